@@ -22,6 +22,44 @@ def get_db_engine() -> Engine:
     return get_engine()
 
 
+def stream_query_to_df(conn, query, params: dict = None, batch_size: int = 1000) -> pd.DataFrame:
+    """Execute a query with a server-side cursor and build a DataFrame in batches.
+
+    Uses stream_results/yield_per so PostgreSQL hands rows over in
+    batch_size chunks instead of buffering the whole result set client-side
+    before DataFrame construction. Peak memory stays at ~one copy of the
+    data rather than rows + DataFrame.
+
+    Args:
+        conn: Active SQLAlchemy Connection
+        query: SQLAlchemy selectable or text clause to execute
+        params: Optional bound parameter values
+        batch_size: Rows per server-side fetch (default: 1000)
+
+    Returns:
+        DataFrame with all result rows (empty DataFrame if no rows)
+    """
+    result = conn.execution_options(
+        stream_results=True, yield_per=batch_size
+    ).execute(query, params or {})
+
+    # from_records with coerce_float gives Numeric columns float64 dtype
+    # immediately instead of object arrays of Decimal
+    columns = result.keys()
+    chunks = [
+        pd.DataFrame.from_records(partition, columns=columns, coerce_float=True)
+        for partition in result.partitions()
+    ]
+
+    if not chunks:
+        return pd.DataFrame()
+
+    if len(chunks) == 1:
+        return chunks[0]
+
+    return pd.concat(chunks, ignore_index=True, copy=False)
+
+
 @st.cache_data(ttl="10m")
 def run_query(query_str: str, params: dict = None) -> pd.DataFrame:
     """Execute a SQL query and return results as a pandas DataFrame.
@@ -38,7 +76,6 @@ def run_query(query_str: str, params: dict = None) -> pd.DataFrame:
     engine = get_db_engine()
 
     with engine.connect() as conn:
-        result = conn.execute(text(query_str), params or {})
-        df = pd.DataFrame(result.fetchall(), columns=result.keys())
-
-    return df
+        # Stream through a server-side cursor so ad-hoc queries never
+        # buffer their full result set client-side before the DataFrame
+        return stream_query_to_df(conn, text(query_str), params)
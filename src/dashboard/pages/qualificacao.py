@@ -11,8 +11,8 @@ import streamlit as st
 from src.dashboard.components.export import render_csv_export
 from src.dashboard.queries.proponentes import (
     get_proponente_estados,
-    get_proponente_stats,
     get_proponentes,
+    get_qualificacao_bundle,
 )
 
 
@@ -51,26 +51,8 @@ def render_qualificacao():
         "📅 **Dados:** Filtrando proponentes com propostas de 2025-2026."
     )
 
-    # --- KPI METRICS ROW ---
-    stats = get_proponente_stats()
-
-    col1, col2, col3, col4 = st.columns(4)
-
-    with col1:
-        st.metric("Total Proponentes", f"{stats['total_count']:,}")
-
-    with col2:
-        st.metric("Total OSCs", f"{stats['osc_count']:,}")
-
-    with col3:
-        st.metric("Total Governo", f"{stats['government_count']:,}")
-
-    with col4:
-        st.metric("Media Propostas/Proponente", f"{stats['avg_propostas']:.1f}")
-
-    st.markdown("---")
-
     # --- FILTERS SIDEBAR ---
+    # (built before the data fetch so stats + rows can share one round-trip)
     st.sidebar.header("Filtros")
 
     # Tipo de Entidade filter
@@ -82,8 +64,7 @@ def render_qualificacao():
     )
 
     # Estado filter
-    estados_disponiveis = get_proponente_estados()
-    estados_disponiveis.insert(0, "Todos")
+    estados_disponiveis = ["Todos", *get_proponente_estados()]
     estado_selected = st.sidebar.selectbox(
         "Estado",
         options=estados_disponiveis,
@@ -110,13 +91,10 @@ def render_qualificacao():
         help="Filtrar proponentes com no maximo N propostas (deixe vazio para ver todos)",
     )
 
-    # Build filters dict
+    # Build filters dict (is_osc is a dedicated argument, not a filter,
+    # because every query shape binds it)
     filters = {}
-
-    if tipo_entidade == "Apenas OSCs":
-        filters["is_osc"] = True
-    elif tipo_entidade == "Apenas Governo":
-        filters["is_osc"] = False
+    is_osc = tipo_entidade != "Apenas Governo"
 
     if estado_selected != "Todos":
         filters["estado"] = estado_selected
@@ -128,32 +106,64 @@ def render_qualificacao():
         filters["max_propostas"] = max_propostas
 
     # --- FETCH DATA ---
-    df_proponentes = get_proponentes(limit=5000, filters=filters)
+    # Keyset pagination: fetch only one page per rerun instead of
+    # materializing 5000 rows. The cursor stack holds the (total_propostas,
+    # nome, rank) key of each visited page's last row so "previous" can
+    # walk back and ranks stay continuous across pages.
+    page_size = 100
+
+    filters_key = repr((is_osc, sorted(filters.items())))
+    if st.session_state.get("qualificacao_filters_key") != filters_key:
+        st.session_state["qualificacao_filters_key"] = filters_key
+        st.session_state["qualificacao_cursors"] = [None]
+
+    cursors = st.session_state["qualificacao_cursors"]
+    cursor = cursors[-1]
+
+    # Stats and the current page come back in a single round-trip
+    bundle = get_qualificacao_bundle(
+        filters=filters,
+        limit=page_size,
+        after=cursor[:2] if cursor else None,
+        is_osc=is_osc,
+        rank_offset=cursor[2] if cursor else 0,
+    )
+    stats = bundle["stats"]
+    df_proponentes = bundle["proponentes"]
+
+    # --- KPI METRICS ROW ---
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        st.metric("Total Proponentes", f"{stats['total_count']:,}")
+
+    with col2:
+        st.metric("Total OSCs", f"{stats['osc_count']:,}")
+
+    with col3:
+        st.metric("Total Governo", f"{stats['government_count']:,}")
+
+    with col4:
+        st.metric("Media Propostas/Proponente", f"{stats['avg_propostas']:.1f}")
+
+    st.markdown("---")
 
     if df_proponentes.empty:
+        if len(cursors) > 1:
+            # Stepped past the end (the previous page was exactly full):
+            # drop the dead cursor and rerun back to the last real page
+            cursors.pop()
+            st.rerun()
         st.warning("Nenhum proponente encontrado com os filtros aplicados.")
         return
 
-    # Make a copy to avoid modifying cached data
-    df = df_proponentes.copy()
+    # rank, tipo, cnpj_formatado, and valor_emendas_formatado are computed
+    # at the SQL layer by get_proponentes - no client-side passes needed
+    df = df_proponentes
 
     # --- MAIN TABLE SECTION ---
     st.subheader(f"Proponentes Ranqueados por Valor ({len(df)} registros)")
 
-    # Add rank column (1-based)
-    df["rank"] = range(1, len(df) + 1)
-
-    # Format CNPJ for display
-    df["cnpj_formatado"] = df["cnpj"].apply(format_cnpj)
-
-    # Determine tipo (OSC/Governo)
-    df["tipo"] = df["is_osc"].apply(lambda x: "OSC" if x else "Governo")
-
-    # Format valor_total_emendas as currency
-    df["valor_emendas_formatado"] = df["valor_total_emendas"].apply(
-        lambda x: f"R$ {x:,.2f}" if pd.notna(x) else "R$ 0,00"
-    )
-
     # Prepare display DataFrame
     display_columns = [
         "rank",
@@ -183,26 +193,54 @@ def render_qualificacao():
     ]
 
     # Highlight virgin proponents (total_propostas == 0) with a badge
-    # We'll use st.dataframe with custom styling
-    def highlight_virgin_proponents(row):
-        """Highlight rows where Propostas == 0 (virgin proponents)."""
-        if row["Propostas"] == 0:
-            return ["background-color: #d4edda"] * len(row)  # Light green
-        return [""] * len(row)
+    # Compute the mask once up front - when no virgins exist we skip the
+    # Styler (and its per-row Python pass) entirely
+    virgin_mask = df["total_propostas"].to_numpy() == 0
+    has_virgins = bool(virgin_mask.any())
+
+    if has_virgins:
+
+        def highlight_virgin_proponents(frame):
+            """Highlight rows where Propostas == 0 (virgin proponents)."""
+            styles = pd.DataFrame("", index=frame.index, columns=frame.columns)
+            styles.loc[virgin_mask] = "background-color: #d4edda"  # Light green
+            return styles
 
-    # Apply styling
-    styled_df = df_display.style.apply(highlight_virgin_proponents, axis=1)
+        rendered = df_display.style.apply(highlight_virgin_proponents, axis=None)
+    else:
+        rendered = df_display
 
     st.dataframe(
-        styled_df,
+        rendered,
         use_container_width=True,
         hide_index=True,
     )
 
     # Legend for highlighting
-    if (df["total_propostas"] == 0).any():
+    if has_virgins:
         st.caption("✨ Linhas destacadas indicam proponentes sem propostas (virgens - maior valor)")
 
+    # --- PAGINATION CONTROLS ---
+    col_prev, col_next = st.columns(2)
+
+    with col_prev:
+        if len(cursors) > 1 and st.button("← Pagina anterior", key="qualificacao_prev"):
+            cursors.pop()
+            st.rerun()
+
+    with col_next:
+        # A full page suggests more rows may follow
+        if len(df) == page_size and st.button("Proxima pagina →", key="qualificacao_next"):
+            last_row = df.iloc[-1]
+            cursors.append(
+                (
+                    int(last_row["total_propostas"]),
+                    last_row["nome"],
+                    int(last_row["rank"]),
+                )
+            )
+            st.rerun()
+
     # --- CONTACT INFO SECTION ---
     st.markdown("---")
     st.subheader("Informacoes de Contato")
@@ -214,6 +252,9 @@ def render_qualificacao():
     # --- CSV EXPORT SECTION ---
     st.markdown("---")
 
+    # Export always uses the full (unpaginated) dump, not the current page
+    df_full = get_proponentes(limit=5000, filters=filters, is_osc=is_osc)
+
     # Prepare export DataFrame with all columns (unformatted CNPJ for data use)
     export_columns = [
         "rank",
@@ -231,7 +272,7 @@ def render_qualificacao():
         "valor_total_emendas",
     ]
 
-    df_export = df[[col for col in export_columns if col in df.columns]].copy()
+    df_export = df_full[[col for col in export_columns if col in df_full.columns]].copy()
 
     # Rename for clarity in export
     df_export.columns = [
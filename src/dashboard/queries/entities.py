@@ -5,10 +5,11 @@ All queries use LIMIT to prevent large result sets from blocking reruns.
 """
 
 from datetime import date, timedelta
+from functools import lru_cache
 
 import pandas as pd
 import streamlit as st
-from sqlalchemy import and_, select, text
+from sqlalchemy import and_, bindparam, select, text, tuple_
 
 from src.dashboard.config import get_db_engine, run_query
 from src.loader.db_models import (
@@ -21,8 +22,100 @@ from src.loader.db_models import (
 )
 
 
+def _result_to_df(result) -> pd.DataFrame:
+    """Build a DataFrame from a Result without per-row dict materialization.
+
+    Row tuples go straight into the columnar constructor instead of being
+    expanded into N dicts via _asdict(), which allocated a dict and did an
+    attribute lookup per row. coerce_float turns Decimal values from
+    Numeric columns into float64 arrays up front, avoiding object-dtype
+    columns that every downstream operation would pay for.
+
+    Args:
+        result: Executed SQLAlchemy Result
+
+    Returns:
+        DataFrame with all result rows (empty DataFrame if no rows)
+    """
+    rows = result.fetchall()
+
+    if not rows:
+        return pd.DataFrame()
+
+    return pd.DataFrame.from_records(rows, columns=result.keys(), coerce_float=True)
+
+
+# Statements with no dynamic filter shape are built once at import time
+# and reused with bound parameters on every call
+_RECENT_PROPOSTAS_STMT = (
+    select(Proposta)
+    .where(Proposta.extraction_date >= bindparam("cutoff"))
+    .order_by(Proposta.extraction_date.desc())
+    .limit(1000)
+)
+_PROGRAMAS_STMT = (
+    select(Programa).order_by(Programa.created_at.desc()).limit(bindparam("lim"))
+)
+_APOIADORES_STMT = (
+    select(Apoiador).order_by(Apoiador.created_at.desc()).limit(bindparam("lim"))
+)
+_EMENDAS_STMT = (
+    select(Emenda).order_by(Emenda.created_at.desc()).limit(bindparam("lim"))
+)
+
+
+@lru_cache(maxsize=None)
+def _propostas_stmt(filter_names: tuple, keyset: bool):
+    """Build the propostas select for a given filter shape (memoized).
+
+    Statements are constructed once per unique combination of active
+    filters and reused with bound parameters, skipping the select() tree
+    rebuild and SQL compilation on every call.
+
+    Args:
+        filter_names: Sorted tuple of active filter keys
+        keyset: Whether a keyset pagination cursor is present
+
+    Returns:
+        Select statement with bindparam placeholders
+    """
+    conditions = []
+    if "estado" in filter_names:
+        conditions.append(Proposta.estado == bindparam("estado"))
+    if "situacao" in filter_names:
+        conditions.append(Proposta.situacao == bindparam("situacao"))
+    if "date_start" in filter_names:
+        conditions.append(Proposta.data_publicacao >= bindparam("date_start"))
+    if "date_end" in filter_names:
+        conditions.append(Proposta.data_publicacao <= bindparam("date_end"))
+    if "year" in filter_names:
+        # Use extraction_date as fallback when data_publicacao is not populated.
+        # Half-open range instead of EXTRACT(YEAR ...) keeps the predicate
+        # sargable so it can use an index range scan.
+        conditions.append(Proposta.extraction_date >= bindparam("year_start"))
+        conditions.append(Proposta.extraction_date < bindparam("year_end"))
+
+    # Keyset (seek) pagination: resume strictly after the previous
+    # page's last (created_at, id) key instead of using OFFSET
+    if keyset:
+        conditions.append(
+            tuple_(Proposta.created_at, Proposta.id)
+            < tuple_(bindparam("after_created_at"), bindparam("after_id"))
+        )
+
+    query = select(Proposta)
+    if conditions:
+        query = query.where(and_(*conditions))
+
+    return query.order_by(
+        Proposta.created_at.desc(), Proposta.id.desc()
+    ).limit(bindparam("lim"))
+
+
 @st.cache_data(ttl="10m")
-def get_propostas(limit: int = 1000, filters: dict = None) -> pd.DataFrame:
+def get_propostas(
+    limit: int = 1000, filters: dict = None, after: tuple = None
+) -> pd.DataFrame:
     """Query propostas table with optional filters.
 
     Args:
@@ -33,6 +126,9 @@ def get_propostas(limit: int = 1000, filters: dict = None) -> pd.DataFrame:
             - date_start: date
             - date_end: date
             - year: int (filter by year from data_publicacao)
+        after: Optional (created_at, id) keyset cursor - only rows sorting
+            strictly after this key (in DESC order) are returned. Use the
+            last row of the previous page to fetch the next one.
 
     Returns:
         DataFrame with proposta records
@@ -40,37 +136,28 @@ def get_propostas(limit: int = 1000, filters: dict = None) -> pd.DataFrame:
     engine = get_db_engine()
     filters = filters or {}
 
-    with engine.connect() as conn:
-        query = select(Proposta)
-
-        # Apply filters
-        conditions = []
-        if filters.get("estado"):
-            conditions.append(Proposta.estado == filters["estado"])
-        if filters.get("situacao"):
-            conditions.append(Proposta.situacao == filters["situacao"])
-        if filters.get("date_start"):
-            conditions.append(Proposta.data_publicacao >= filters["date_start"])
-        if filters.get("date_end"):
-            conditions.append(Proposta.data_publicacao <= filters["date_end"])
-        if filters.get("year"):
-            from sqlalchemy import extract
-            # Use extraction_date as fallback when data_publicacao is not populated
-            conditions.append(extract('year', Proposta.extraction_date) == filters["year"])
-
-        if conditions:
-            query = query.where(and_(*conditions))
-
-        query = query.order_by(Proposta.created_at.desc()).limit(limit)
-
-        result = conn.execute(query)
-        rows = result.fetchall()
-
-        if not rows:
-            return pd.DataFrame()
+    # Active filters determine the statement shape; values are bound params
+    active = tuple(
+        sorted(
+            name
+            for name in ("estado", "situacao", "date_start", "date_end", "year")
+            if filters.get(name)
+        )
+    )
+    query = _propostas_stmt(active, keyset=after is not None)
+
+    params = {name: filters[name] for name in active if name != "year"}
+    params["lim"] = limit
+    if "year" in active:
+        year = int(filters["year"])
+        params["year_start"] = date(year, 1, 1)
+        params["year_end"] = date(year + 1, 1, 1)
+    if after is not None:
+        params["after_created_at"], params["after_id"] = after
 
-        df = pd.DataFrame([row._asdict() for row in rows])
-        return df
+    with engine.connect() as conn:
+        result = conn.execute(query, params)
+        return _result_to_df(result)
 
 
 @st.cache_data(ttl="10m")
@@ -91,21 +178,8 @@ def get_recent_propostas(days: int = 7) -> pd.DataFrame:
     engine = get_db_engine()
 
     with engine.connect() as conn:
-        query = (
-            select(Proposta)
-            .where(Proposta.extraction_date >= cutoff_date)
-            .order_by(Proposta.extraction_date.desc())
-            .limit(1000)
-        )
-
-        result = conn.execute(query)
-        rows = result.fetchall()
-
-        if not rows:
-            return pd.DataFrame()
-
-        df = pd.DataFrame([row._asdict() for row in rows])
-        return df
+        result = conn.execute(_RECENT_PROPOSTAS_STMT, {"cutoff": cutoff_date})
+        return _result_to_df(result)
 
 
 @st.cache_data(ttl="10m")
@@ -122,15 +196,8 @@ def get_programas(limit: int = 1000, filters: dict = None) -> pd.DataFrame:
     engine = get_db_engine()
 
     with engine.connect() as conn:
-        query = select(Programa).order_by(Programa.created_at.desc()).limit(limit)
-        result = conn.execute(query)
-        rows = result.fetchall()
-
-        if not rows:
-            return pd.DataFrame()
-
-        df = pd.DataFrame([row._asdict() for row in rows])
-        return df
+        result = conn.execute(_PROGRAMAS_STMT, {"lim": limit})
+        return _result_to_df(result)
 
 
 @st.cache_data(ttl="10m")
@@ -147,15 +214,8 @@ def get_apoiadores(limit: int = 1000, filters: dict = None) -> pd.DataFrame:
     engine = get_db_engine()
 
     with engine.connect() as conn:
-        query = select(Apoiador).order_by(Apoiador.created_at.desc()).limit(limit)
-        result = conn.execute(query)
-        rows = result.fetchall()
-
-        if not rows:
-            return pd.DataFrame()
-
-        df = pd.DataFrame([row._asdict() for row in rows])
-        return df
+        result = conn.execute(_APOIADORES_STMT, {"lim": limit})
+        return _result_to_df(result)
 
 
 @st.cache_data(ttl="10m")
@@ -172,15 +232,8 @@ def get_emendas(limit: int = 1000, filters: dict = None) -> pd.DataFrame:
     engine = get_db_engine()
 
     with engine.connect() as conn:
-        query = select(Emenda).order_by(Emenda.created_at.desc()).limit(limit)
-        result = conn.execute(query)
-        rows = result.fetchall()
-
-        if not rows:
-            return pd.DataFrame()
-
-        df = pd.DataFrame([row._asdict() for row in rows])
-        return df
+        result = conn.execute(_EMENDAS_STMT, {"lim": limit})
+        return _result_to_df(result)
 
 
 @st.cache_data(ttl="10m")
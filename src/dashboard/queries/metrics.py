@@ -46,14 +46,14 @@ def get_entity_counts() -> dict:
 
 
 @st.cache_data(ttl="10m")
-def get_data_freshness() -> dict:
-    """Get data freshness information from most recent extraction.
+def _get_last_extraction() -> datetime | None:
+    """Get the run_date of the most recent extraction (cached).
+
+    Only the DB lookup is cached - the "hours ago" math lives outside the
+    cache so the cached value stays stable and reusable across widgets.
 
     Returns:
-        Dictionary with:
-        - last_extraction: datetime of most recent extraction (or None)
-        - hours_ago: hours since last extraction (or None)
-        - status: "fresh" (<25h), "stale" (<48h), "critical" (>48h), or "no_data"
+        Timezone-aware datetime of the most recent extraction, or None
     """
     engine = get_db_engine()
 
@@ -66,33 +66,50 @@ def get_data_freshness() -> dict:
         )
         row = result.fetchone()
 
-        if not row or row[0] is None:
-            return {
-                "last_extraction": None,
-                "hours_ago": None,
-                "status": "no_data",
-            }
+    if not row or row[0] is None:
+        return None
+
+    last_extraction = row[0]
+
+    # Make last_extraction timezone-aware if it isn't
+    if last_extraction.tzinfo is None:
+        last_extraction = last_extraction.replace(tzinfo=timezone.utc)
 
-        last_extraction = row[0]
+    return last_extraction
 
-        # Calculate hours ago
-        now = datetime.now(timezone.utc)
-        # Make last_extraction timezone-aware if it isn't
-        if last_extraction.tzinfo is None:
-            last_extraction = last_extraction.replace(tzinfo=timezone.utc)
 
-        hours_ago = (now - last_extraction).total_seconds() / 3600
+def get_data_freshness() -> dict:
+    """Get data freshness information from most recent extraction.
 
-        # Determine status
-        if hours_ago < 25:
-            status = "fresh"
-        elif hours_ago < 48:
-            status = "stale"
-        else:
-            status = "critical"
+    Returns:
+        Dictionary with:
+        - last_extraction: datetime of most recent extraction (or None)
+        - hours_ago: hours since last extraction (or None)
+        - status: "fresh" (<25h), "stale" (<48h), "critical" (>48h), or "no_data"
+    """
+    last_extraction = _get_last_extraction()
 
+    if last_extraction is None:
         return {
-            "last_extraction": last_extraction,
-            "hours_ago": hours_ago,
-            "status": status,
+            "last_extraction": None,
+            "hours_ago": None,
+            "status": "no_data",
         }
+
+    # Clock-dependent math stays outside the cache
+    now = datetime.now(timezone.utc)
+    hours_ago = (now - last_extraction).total_seconds() / 3600
+
+    # Determine status
+    if hours_ago < 25:
+        status = "fresh"
+    elif hours_ago < 48:
+        status = "stale"
+    else:
+        status = "critical"
+
+    return {
+        "last_extraction": last_extraction,
+        "hours_ago": hours_ago,
+        "status": status,
+    }
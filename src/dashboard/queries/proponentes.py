@@ -5,88 +5,308 @@ Specifically designed for client qualification workflow - ranks proponents by va
 (fewer proposals = higher value = more receptive to new partnerships).
 """
 
+from functools import lru_cache
+
 import pandas as pd
 import streamlit as st
-from sqlalchemy import and_, func, select
+from sqlalchemy import and_, bindparam, case, func, literal, select, text, tuple_
+
+from src.dashboard.config import get_db_engine, stream_query_to_df
+from src.loader.db_models import Proponente, ProponenteStatsCache
+
+
+@lru_cache(maxsize=None)
+def _proponentes_stmt(filter_names: tuple, keyset: bool):
+    """Build the proponentes select for a given filter shape (memoized).
+
+    One statement per unique combination of active filters, reused with
+    bound parameters - psycopg sees stable statement text and can promote
+    it to a server-side prepared plan, and SQLAlchemy skips rebuilding and
+    recompiling the select() tree per call.
+
+    Args:
+        filter_names: Sorted tuple of active filter keys ("search_cnpj" /
+            "search_nome" encode which search mode is active)
+        keyset: Whether a keyset pagination cursor is present
+
+    Returns:
+        Select statement with bindparam placeholders
+    """
+    # Query proponentes directly - pipeline already filters to 2025-2026 OSC data
+    # Note: data_publicacao is not populated from source CSV, so we cannot filter by it.
+    # The pipeline's ANO_PROP filter ensures only 2025-2026 records are loaded.
+    # Display columns are computed in SQL so the page doesn't need
+    # row-wise pandas .apply() passes over the full result set.
+    query = select(
+        Proponente,
+        # The window numbers rows within the current (keyset-filtered) page,
+        # so the caller's cursor offset is added back to keep ranks absolute
+        # across pages
+        (
+            func.row_number().over(
+                order_by=(Proponente.total_propostas.asc(), Proponente.nome)
+            )
+            + bindparam("rank_offset")
+        ).label("rank"),
+        case(
+            (Proponente.is_osc == True, "OSC"), else_="Governo"
+        ).label("tipo"),
+        func.regexp_replace(
+            Proponente.cnpj,
+            r"^(..)(...)(...)(....)(..)$",
+            r"\1.\2.\3/\4-\5",
+        ).label("cnpj_formatado"),
+        (
+            literal("R$ ")
+            + func.to_char(
+                func.coalesce(Proponente.valor_total_emendas, 0.0),
+                "FM999,999,999,990.00",
+            )
+        ).label("valor_emendas_formatado"),
+    )
+
+    # is_osc is always a bound parameter - every statement shape filters
+    # on it, which also lets the planner pick the partial OSC index
+    conditions = [Proponente.is_osc == bindparam("is_osc")]
+
+    if "estado" in filter_names:
+        conditions.append(Proponente.estado == bindparam("estado"))
+
+    if "search_cnpj" in filter_names:
+        # CNPJs are stored digits-only (normalize_cnpj), so numeric
+        # input becomes a B-tree prefix match instead of ILIKE
+        conditions.append(Proponente.cnpj.like(bindparam("search")))
+    elif "search_nome" in filter_names:
+        conditions.append(Proponente.nome.ilike(bindparam("search")))
+
+    if "min_propostas" in filter_names:
+        conditions.append(Proponente.total_propostas >= bindparam("min_propostas"))
+
+    if "max_propostas" in filter_names:
+        conditions.append(Proponente.total_propostas <= bindparam("max_propostas"))
+
+    # Keyset (seek) pagination: resume strictly after the previous
+    # page's last (total_propostas, nome) key instead of using OFFSET
+    if keyset:
+        conditions.append(
+            tuple_(Proponente.total_propostas, Proponente.nome)
+            > tuple_(bindparam("after_tp"), bindparam("after_nome"))
+        )
+
+    query = query.where(and_(*conditions))
 
-from src.dashboard.config import get_db_engine
-from src.loader.db_models import Proponente
+    # Order by total_propostas ASC - fewer proposals = higher value
+    # (nome tiebreak keeps the ordering aligned with the rank window)
+    return query.order_by(
+        Proponente.total_propostas.asc(), Proponente.nome
+    ).limit(bindparam("lim"))
 
 
 @st.cache_data(ttl="10m")
-def get_proponentes(limit: int = 5000, filters: dict = None) -> pd.DataFrame:
+def get_proponentes(
+    limit: int = 5000,
+    filters: dict = None,
+    after: tuple = None,
+    is_osc: bool = True,
+    rank_offset: int = 0,
+) -> pd.DataFrame:
     """Query proponentes table with optional filters.
 
     Args:
         limit: Maximum number of rows to return (default: 5000)
         filters: Optional dict with filter criteria:
-            - is_osc: bool (filter by OSC classification)
             - estado: str (filter by state UF code)
             - search: str (ILIKE search on nome or cnpj)
             - min_propostas: int (filter by minimum proposal count)
             - max_propostas: int (filter by maximum proposal count)
+        after: Optional (total_propostas, nome) keyset cursor - only rows
+            sorting strictly after this key are returned. Use the last row
+            of the previous page to fetch the next one without OFFSET.
+        is_osc: Classification filter (default True - client qualification
+            targets OSCs only)
+        rank_offset: Absolute rank of the row preceding this page (0 for
+            the first page). ROW_NUMBER restarts at 1 on the keyset-filtered
+            set, so this keeps the rank column continuous across pages.
 
     Returns:
         DataFrame with proponente records ordered by total_propostas ASC
-        (fewer proposals = higher value = shown first)
+        (fewer proposals = higher value = shown first). Includes display
+        columns computed at the SQL layer: rank, tipo, cnpj_formatado,
+        valor_emendas_formatado.
     """
     engine = get_db_engine()
     filters = filters or {}
 
+    # Determine the statement shape from the active filters; values bind
+    # as parameters so each shape compiles exactly once
+    active = []
+    params: dict = {"lim": limit, "is_osc": is_osc, "rank_offset": rank_offset}
+
+    if filters.get("estado"):
+        active.append("estado")
+        params["estado"] = filters["estado"]
+
+    # Skip sub-3-char terms: below the trigram minimum the indexes
+    # can't help and the clause degenerates to a full scan
+    search = (filters.get("search") or "").strip()
+    if len(search) >= 3:
+        digits = search.replace(".", "").replace("/", "").replace("-", "")
+        if digits.isdigit():
+            active.append("search_cnpj")
+            params["search"] = f"{digits}%"
+        else:
+            active.append("search_nome")
+            params["search"] = f"%{search}%"
+
+    if filters.get("min_propostas") is not None:
+        active.append("min_propostas")
+        params["min_propostas"] = filters["min_propostas"]
+
+    if filters.get("max_propostas") is not None:
+        active.append("max_propostas")
+        params["max_propostas"] = filters["max_propostas"]
+
+    if after is not None:
+        params["after_tp"], params["after_nome"] = after
+
+    query = _proponentes_stmt(tuple(sorted(active)), keyset=after is not None)
+
     with engine.connect() as conn:
-        # Query proponentes directly - pipeline already filters to 2025-2026 OSC data
-        # Note: data_publicacao is not populated from source CSV, so we cannot filter by it.
-        # The pipeline's ANO_PROP filter ensures only 2025-2026 records are loaded.
-        query = select(Proponente)
+        # Stream through a server-side cursor - the export path pulls up to
+        # 5000 wide rows and fetchall() would hold two full copies in memory
+        df = stream_query_to_df(conn, query, params)
 
-        # Apply filters
-        conditions = []
+    if not df.empty:
+        # Counts fit comfortably in int32; halves the footprint of the two
+        # widest-used numeric columns without copying when already narrow
+        df["total_propostas"] = df["total_propostas"].astype("int32", copy=False)
+        df["total_emendas"] = df["total_emendas"].astype("int32", copy=False)
 
-        # ALWAYS filter to OSCs only (per user requirement)
-        conditions.append(Proponente.is_osc == True)
+    return df
 
-        if filters.get("is_osc") is not None:
-            # Override if explicitly set in filters
-            conditions[-1] = Proponente.is_osc == filters["is_osc"]
 
-        if filters.get("estado"):
-            conditions.append(Proponente.estado == filters["estado"])
+@st.cache_data(ttl="10m")
+def get_qualificacao_bundle(
+    filters: dict = None,
+    limit: int = 100,
+    after: tuple = None,
+    is_osc: bool = True,
+    rank_offset: int = 0,
+) -> dict:
+    """Fetch aggregate stats and one proponente page in a single round-trip.
+
+    On a cold cache the qualificacao page previously issued separate
+    queries for stats and rows (plus estados, which is now a per-process
+    resource). This bundles the remaining two payloads into one CTE query
+    so the initial render costs one DB round-trip instead of several.
 
-        if filters.get("search"):
-            search_term = f"%{filters['search']}%"
-            conditions.append(
-                (Proponente.nome.ilike(search_term))
-                | (Proponente.cnpj.ilike(search_term))
-            )
+    Args:
+        filters: Same filter dict accepted by get_proponentes
+        limit: Maximum number of proponente rows to return
+        after: Optional (total_propostas, nome) keyset cursor
+        is_osc: Classification filter (default True)
+        rank_offset: Absolute rank of the row preceding this page (0 for
+            the first page) - keeps ROW_NUMBER continuous across pages
 
-        if filters.get("min_propostas") is not None:
-            conditions.append(Proponente.total_propostas >= filters["min_propostas"])
+    Returns:
+        Dictionary with:
+        - stats: Same payload as get_proponente_stats
+        - proponentes: Same DataFrame as get_proponentes
+    """
+    engine = get_db_engine()
+    filters = filters or {}
 
-        if filters.get("max_propostas") is not None:
-            conditions.append(Proponente.total_propostas <= filters["max_propostas"])
+    conditions = ["p.is_osc = :is_osc"]
+    params: dict = {"lim": limit, "is_osc": is_osc, "rank_offset": rank_offset}
+
+    if filters.get("estado"):
+        conditions.append("p.estado = :estado")
+        params["estado"] = filters["estado"]
+
+    # Skip sub-3-char terms: below the trigram minimum the indexes
+    # can't help and the clause degenerates to a full scan
+    search = (filters.get("search") or "").strip()
+    if len(search) >= 3:
+        digits = search.replace(".", "").replace("/", "").replace("-", "")
+        if digits.isdigit():
+            # CNPJs are stored digits-only (normalize_cnpj), so numeric
+            # input becomes a B-tree prefix match instead of ILIKE
+            conditions.append("p.cnpj LIKE :search")
+            params["search"] = f"{digits}%"
+        else:
+            conditions.append("p.nome ILIKE :search")
+            params["search"] = f"%{search}%"
+
+    if filters.get("min_propostas") is not None:
+        conditions.append("p.total_propostas >= :min_propostas")
+        params["min_propostas"] = filters["min_propostas"]
+
+    if filters.get("max_propostas") is not None:
+        conditions.append("p.total_propostas <= :max_propostas")
+        params["max_propostas"] = filters["max_propostas"]
+
+    if after is not None:
+        conditions.append("(p.total_propostas, p.nome) > (:after_tp, :after_nome)")
+        params["after_tp"], params["after_nome"] = after
+
+    where_clause = " AND ".join(conditions)
+
+    sql = f"""
+        WITH rows AS (
+            SELECT p.*,
+                   ROW_NUMBER() OVER (ORDER BY p.total_propostas ASC, p.nome) + :rank_offset AS rank,
+                   CASE WHEN p.is_osc THEN 'OSC' ELSE 'Governo' END AS tipo,
+                   regexp_replace(p.cnpj, '^(..)(...)(...)(....)(..)$', '\\1.\\2.\\3/\\4-\\5') AS cnpj_formatado,
+                   'R$ ' || to_char(coalesce(p.valor_total_emendas, 0), 'FM999,999,999,990.00') AS valor_emendas_formatado
+            FROM proponentes p
+            WHERE {where_clause}
+            ORDER BY p.total_propostas ASC, p.nome
+            LIMIT :lim
+        ),
+        stats AS (
+            SELECT COUNT(*) AS total_count,
+                   COUNT(*) FILTER (WHERE is_osc) AS osc_count,
+                   AVG(total_propostas) FILTER (WHERE is_osc) AS avg_propostas
+            FROM proponentes
+        )
+        SELECT (SELECT json_build_object(
+                    'total_count', total_count,
+                    'osc_count', osc_count,
+                    'avg_propostas', avg_propostas
+                ) FROM stats) AS stats,
+               (SELECT json_agg(row_to_json(rows)) FROM rows) AS proponentes
+    """
 
-        if conditions:
-            query = query.where(and_(*conditions))
+    with engine.connect() as conn:
+        row = conn.execute(text(sql), params).fetchone()
 
-        # Order by total_propostas ASC - fewer proposals = higher value
-        query = query.order_by(Proponente.total_propostas.asc()).limit(limit)
+    raw_stats = row[0] or {}
+    total_count = raw_stats.get("total_count") or 0
+    osc_count = raw_stats.get("osc_count") or 0
+    avg_propostas = raw_stats.get("avg_propostas") or 0.0
 
-        result = conn.execute(query)
-        rows = result.fetchall()
+    stats = {
+        "total_count": total_count,
+        "osc_count": osc_count,
+        "government_count": total_count - osc_count,
+        "avg_propostas": round(float(avg_propostas), 2),
+    }
 
-        if not rows:
-            return pd.DataFrame()
+    proponentes = pd.DataFrame(row[1] or [])
 
-        df = pd.DataFrame([row._asdict() for row in rows])
-        return df
+    return {"stats": stats, "proponentes": proponentes}
 
 
-@st.cache_data(ttl="10m")
-def get_proponente_estados() -> list[str]:
+@st.cache_resource(ttl=24 * 3600)
+def get_proponente_estados() -> tuple[str, ...]:
     """Get distinct estado values for filter dropdown.
 
+    The UF set is effectively static (27 Brazilian states), so this is a
+    per-process resource refreshed daily rather than a 10-minute data
+    cache - the DISTINCT scan runs once per worker, not once per expiry.
+
     Returns:
-        List of unique estado UF codes, sorted alphabetically
+        Tuple of unique estado UF codes, sorted alphabetically
     """
     engine = get_db_engine()
 
@@ -104,14 +324,16 @@ def get_proponente_estados() -> list[str]:
         result = conn.execute(query)
         rows = result.fetchall()
 
-        estados = sorted([row[0] for row in rows if row[0]])
-        return estados
+        return tuple(sorted(row[0] for row in rows if row[0]))
 
 
-@st.cache_data(ttl="10m")
+@st.cache_resource(ttl="10m")
 def get_proponente_stats() -> dict:
     """Get aggregate statistics about proponentes.
 
+    Cached as a resource so the small stats dict is returned by reference
+    instead of being pickled on every lookup. Callers must not mutate it.
+
     Returns:
         Dictionary with:
         - total_count: Total number of proponentes
@@ -121,34 +343,39 @@ def get_proponente_stats() -> dict:
     """
     engine = get_db_engine()
 
-    with engine.connect() as conn:
-        # Total count (all proponentes - pipeline already filters to 2025-2026)
-        total_query = select(func.count(Proponente.id))
-        total_result = conn.execute(total_query)
-        total_count = total_result.scalar() or 0
-
-        # OSC count
-        osc_query = (
-            select(func.count(Proponente.id))
-            .where(Proponente.is_osc == True)
-        )
-        osc_result = conn.execute(osc_query)
-        osc_count = osc_result.scalar() or 0
-
-        # Government count
-        gov_count = total_count - osc_count
-
-        # Average propostas (for OSCs only)
-        avg_query = (
-            select(func.avg(Proponente.total_propostas))
-            .where(Proponente.is_osc == True)
-        )
-        avg_result = conn.execute(avg_query)
-        avg_propostas = avg_result.scalar() or 0.0
-
-        return {
-            "total_count": total_count,
-            "osc_count": osc_count,
-            "government_count": gov_count,
-            "avg_propostas": round(avg_propostas, 2),
-        }
+    # One read-only transaction: the cache probe and any fallback
+    # aggregate share a single MVCC snapshot instead of one per statement
+    with engine.connect().execution_options(postgresql_readonly=True) as conn, conn.begin():
+        # Fast path: the loader materializes these aggregates into a
+        # singleton cache row after every extraction
+        cached = conn.execute(select(ProponenteStatsCache).limit(1)).fetchone()
+
+        if cached is not None:
+            total_count = cached.total_count or 0
+            osc_count = cached.osc_count or 0
+            avg_propostas = cached.avg_propostas or 0.0
+        else:
+            # Fallback: cache not populated yet - one scan with FILTER
+            # aggregates instead of three separate SELECTs
+            row = conn.execute(
+                select(
+                    func.count(Proponente.id).label("total"),
+                    func.count(Proponente.id)
+                    .filter(Proponente.is_osc == True)
+                    .label("osc"),
+                    func.avg(Proponente.total_propostas)
+                    .filter(Proponente.is_osc == True)
+                    .label("avg"),
+                )
+            ).one()
+
+            total_count = row.total or 0
+            osc_count = row.osc or 0
+            avg_propostas = row.avg or 0.0
+
+    return {
+        "total_count": total_count,
+        "osc_count": osc_count,
+        "government_count": total_count - osc_count,
+        "avg_propostas": round(avg_propostas, 2),
+    }
@@ -22,6 +22,15 @@ st.set_page_config(
     layout="wide",
 )
 
+# Import all page modules once at server warm-up so the first navigation
+# click doesn't pay the cold-import cost of the selected page
+from src.dashboard.pages.apoiadores import render_apoiadores
+from src.dashboard.pages.emendas import render_emendas
+from src.dashboard.pages.home import render_home
+from src.dashboard.pages.programas import render_programas
+from src.dashboard.pages.propostas import render_propostas
+from src.dashboard.pages.qualificacao import render_qualificacao
+
 # Initialize session state
 if "selected_proposta_id" not in st.session_state:
     st.session_state.selected_proposta_id = None
@@ -36,43 +45,31 @@ if "active_entity_filter" not in st.session_state:
 # Define page functions (placeholders for pages not yet implemented)
 def home_page():
     """Home/overview page with KPI metrics and recent data."""
-    from src.dashboard.pages.home import render_home
-
     render_home()
 
 
 def propostas_page():
     """Propostas entity page with interactive data table and cross-filtering."""
-    from src.dashboard.pages.propostas import render_propostas
-
     render_propostas()
 
 
 def programas_page():
     """Programas entity page with cross-filter awareness."""
-    from src.dashboard.pages.programas import render_programas
-
     render_programas()
 
 
 def apoiadores_page():
     """Apoiadores entity page with cross-filter awareness."""
-    from src.dashboard.pages.apoiadores import render_apoiadores
-
     render_apoiadores()
 
 
 def emendas_page():
     """Emendas entity page with cross-filter awareness."""
-    from src.dashboard.pages.emendas import render_emendas
-
     render_emendas()
 
 
 def qualificacao_page():
     """Qualificacao de Proponentes page for client discovery and prospecting."""
-    from src.dashboard.pages.qualificacao import render_qualificacao
-
     render_qualificacao()
 
 
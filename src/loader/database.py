@@ -12,9 +12,10 @@ The pipeline uses synchronous SQLAlchemy (not async) because:
 - psycopg3 is used under the hood when available
 """
 
+from contextlib import contextmanager
 from typing import Generator
 
-from sqlalchemy import create_engine, Engine
+from sqlalchemy import create_engine, text, Engine
 from sqlalchemy.orm import Session, sessionmaker
 
 from src.config import get_settings
@@ -22,8 +23,9 @@ from src.loader.db_models import Base
 from src.monitor.logger import logger
 
 
-# Module-level engine cache for lazy initialization
+# Module-level engine and session factory caches for lazy initialization
 _engine: Engine | None = None
+_session_factory: sessionmaker | None = None
 
 
 def create_db_engine(database_url: str) -> Engine:
@@ -46,6 +48,10 @@ def create_db_engine(database_url: str) -> Engine:
         pool_size=5,  # Maintain 5 persistent connections
         max_overflow=10,  # Allow up to 10 additional connections under load
         pool_pre_ping=True,  # Verify connections before use (detects stale connections)
+        pool_recycle=1800,  # Recycle idle connections after 30 min
+        query_cache_size=1200,  # Compiled-SQL cache sized for the dashboard's query mix
+        insertmanyvalues_page_size=1000,  # Batch ORM/Core executemany inserts 1000 rows per statement
+        connect_args={"prepare_threshold": 3},  # psycopg3: server-side prepare after 3 uses
         echo=False,  # Don't log SQL by default (set True for debugging)
     )
     return engine
@@ -76,7 +82,58 @@ def init_db(engine: Engine) -> None:
     Args:
         engine: SQLAlchemy Engine instance
     """
+    # pg_trgm backs the trigram (gin_trgm_ops) indexes on proponentes
+    with engine.begin() as conn:
+        conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+
     Base.metadata.create_all(engine)
+
+    # create_all never ALTERs tables that already exist, so columns and
+    # indexes added after a deployment's first run have to be applied here
+    # explicitly. Fresh databases get them from CREATE TABLE; every
+    # statement below is a no-op there.
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "ALTER TABLE extraction_logs "
+                "ADD COLUMN IF NOT EXISTS fingerprints JSON"
+            )
+        )
+
+        # ix_data_lineage_source was widened in place from (source_file) to
+        # (source_file, entity_type); drop the old single-column definition
+        # so the CREATE below can rebuild it with both columns
+        conn.execute(
+            text(
+                "DO $$ BEGIN "
+                "IF EXISTS (SELECT 1 FROM pg_indexes "
+                "           WHERE indexname = 'ix_data_lineage_source' "
+                "           AND indexdef NOT LIKE '%entity_type%') THEN "
+                "    DROP INDEX ix_data_lineage_source; "
+                "END IF; "
+                "END $$"
+            )
+        )
+
+        # Mirrors the Index() definitions in db_models; keep the two in sync
+        for index_sql in (
+            "CREATE INDEX IF NOT EXISTS ix_proponentes_osc_total "
+            "ON proponentes (is_osc, total_propostas)",
+            "CREATE INDEX IF NOT EXISTS ix_proponentes_estado "
+            "ON proponentes (estado)",
+            "CREATE INDEX IF NOT EXISTS ix_proponentes_osc_tp "
+            "ON proponentes (total_propostas) WHERE is_osc",
+            "CREATE INDEX IF NOT EXISTS ix_proponentes_nome_trgm "
+            "ON proponentes USING gin (nome gin_trgm_ops)",
+            "CREATE INDEX IF NOT EXISTS ix_proponentes_cnpj_trgm "
+            "ON proponentes USING gin (cnpj gin_trgm_ops)",
+            "CREATE INDEX IF NOT EXISTS ix_extraction_logs_run_date "
+            "ON extraction_logs (run_date)",
+            "CREATE INDEX IF NOT EXISTS ix_data_lineage_source "
+            "ON data_lineage (source_file, entity_type)",
+        ):
+            conn.execute(text(index_sql))
+
     logger.info("Database schema initialized")
 
 
@@ -89,22 +146,24 @@ def get_engine() -> Engine:
     Returns:
         Cached SQLAlchemy Engine instance
     """
-    global _engine
+    global _engine, _session_factory
 
     if _engine is None:
         settings = get_settings()
         _engine = create_db_engine(settings.database.url)
+        _session_factory = create_session_factory(_engine)
         logger.debug("Created database engine")
 
     return _engine
 
 
+@contextmanager
 def get_session() -> Generator[Session, None, None]:
     """Get a database session as a context manager.
 
     Convenience function that creates a new session from the cached
-    engine. The caller should use this in a 'with' statement or
-    explicitly close the session when done.
+    engine and its shared session factory. Use in a 'with' statement;
+    the session is closed on exit.
 
     Yields:
         SQLAlchemy Session instance
@@ -113,9 +172,8 @@ def get_session() -> Generator[Session, None, None]:
         with get_session() as session:
             results = session.execute(text("SELECT 1"))
     """
-    engine = get_engine()
-    SessionLocal = create_session_factory(engine)
-    session = SessionLocal()
+    get_engine()  # Ensures the shared session factory is initialized
+    session = _session_factory()
 
     try:
         yield session
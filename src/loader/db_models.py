@@ -22,6 +22,7 @@ from datetime import date, datetime
 from typing import Optional
 
 from sqlalchemy import (
+    JSON,
     Date,
     DateTime,
     Float,
@@ -30,6 +31,7 @@ from sqlalchemy import (
     Text,
     UniqueConstraint,
     func,
+    text,
 )
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
@@ -92,6 +94,34 @@ class Proponente(Base):
     )
     extraction_date: Mapped[Optional[date]] = mapped_column(Date)
 
+    __table_args__ = (
+        # Covers the qualificacao listing: WHERE is_osc ORDER BY
+        # total_propostas LIMIT N becomes an index scan with no sort
+        Index("ix_proponentes_osc_total", "is_osc", "total_propostas"),
+        Index("ix_proponentes_estado", "estado"),
+        # Partial index for the filtered top-N path: the rank window /
+        # ORDER BY total_propostas over OSCs can stop after LIMIT matches
+        Index(
+            "ix_proponentes_osc_tp",
+            "total_propostas",
+            postgresql_where=text("is_osc"),
+        ),
+        # Trigram indexes make the search box's ILIKE '%term%' predicates
+        # index probes instead of full scans (requires pg_trgm extension)
+        Index(
+            "ix_proponentes_nome_trgm",
+            "nome",
+            postgresql_using="gin",
+            postgresql_ops={"nome": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_proponentes_cnpj_trgm",
+            "cnpj",
+            postgresql_using="gin",
+            postgresql_ops={"cnpj": "gin_trgm_ops"},
+        ),
+    )
+
 
 class Proposta(Base):
     """Transfer proposals/applications submitted by entities."""
@@ -223,11 +253,34 @@ class PropostaEmenda(Base):
     )
 
 
+class ProponenteStatsCache(Base):
+    """Singleton row caching aggregate proponente stats for the dashboard.
+
+    Refreshed by the loader after each extraction (the only writer of
+    proponente data), so dashboard stat lookups are an O(1) single-row
+    read instead of re-aggregating the proponentes table.
+    """
+
+    __tablename__ = "proponente_stats_cache"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    total_count: Mapped[int] = mapped_column(default=0)
+    osc_count: Mapped[int] = mapped_column(default=0)
+    avg_propostas: Mapped[Optional[float]] = mapped_column(Float)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, server_default=func.now(), onupdate=func.now()
+    )
+
+
 class ExtractionLog(Base):
     """Audit trail for each pipeline extraction execution."""
 
     __tablename__ = "extraction_logs"
 
+    # ORDER BY run_date DESC LIMIT 1 (health checks, freshness) terminates
+    # after one row via a backward index scan instead of sorting the table
+    __table_args__ = (Index("ix_extraction_logs_run_date", "run_date"),)
+
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     run_date: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
     status: Mapped[str] = mapped_column(
@@ -240,6 +293,9 @@ class ExtractionLog(Base):
     records_skipped: Mapped[Optional[int]] = mapped_column()
     duration_seconds: Mapped[Optional[float]] = mapped_column(Float)
     error_message: Mapped[Optional[str]] = mapped_column(Text)
+    # Per-table content fingerprints ({table: hash}) - lets the next run
+    # skip tables whose payload is byte-identical to this one
+    fingerprints: Mapped[Optional[dict]] = mapped_column(JSON)
 
 
 class DataLineage(Base):
@@ -266,5 +322,8 @@ class DataLineage(Base):
 
     __table_args__ = (
         Index("ix_data_lineage_entity", "entity_type", "entity_id"),
-        Index("ix_data_lineage_source", "source_file"),
+        # Matches the reconciliation access pattern: grouped/filtered
+        # counts on (source_file, entity_type) become index-only scans,
+        # and the source_file prefix serves query_lineage on its own
+        Index("ix_data_lineage_source", "source_file", "entity_type"),
     )
@@ -13,6 +13,7 @@ Design principles:
 from datetime import datetime
 from typing import Optional
 
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from src.loader.db_models import ExtractionLog
@@ -66,15 +67,26 @@ def create_extraction_log(
     records_inserted: Optional[int] = 0
     records_updated: Optional[int] = 0
     records_skipped: Optional[int] = None
+    fingerprints: Optional[dict[str, str]] = None
 
     if stats:
         files_downloaded = len(stats)
+        records_skipped = 0
+        # Single pass, one lookup per counter per table (instead of reading
+        # "inserted"/"updated" twice each)
         for table_stats in stats.values():
-            total_records += table_stats.get("inserted", 0) + table_stats.get(
-                "updated", 0
-            )
             records_inserted += table_stats.get("inserted", 0)
             records_updated += table_stats.get("updated", 0)
+            records_skipped += table_stats.get("skipped", 0)
+        total_records = records_inserted + records_updated
+
+        # Persist per-table content fingerprints so the next run can skip
+        # tables whose payload is unchanged
+        fingerprints = {
+            name: table_stats["fingerprint"]
+            for name, table_stats in stats.items()
+            if table_stats.get("fingerprint")
+        } or None
 
     # Create the log entry
     log_entry = ExtractionLog(
@@ -86,6 +98,7 @@ def create_extraction_log(
         records_skipped=records_skipped,
         duration_seconds=duration,
         error_message=error,
+        fingerprints=fingerprints,
     )
 
     # Add to session and flush to get ID (don't commit - caller manages transaction)
@@ -120,11 +133,10 @@ def get_last_extraction(session: Session) -> Optional[ExtractionLog]:
         >>> if log:
         ...     print(f"Last extraction: {log.status} at {log.run_date}")
     """
-    last_log = (
-        session.query(ExtractionLog)
-        .order_by(ExtractionLog.run_date.desc())
-        .limit(1)
-        .first()
+    # 2.0-style select: with ix_extraction_logs_run_date in place this is
+    # an index-tip fetch (backward scan, stops after one row)
+    last_log = session.scalar(
+        select(ExtractionLog).order_by(ExtractionLog.run_date.desc()).limit(1)
     )
 
     if last_log:
@@ -4,35 +4,75 @@ Alerting module for PROJETUS.
 Provides multi-channel alerting via Telegram and email with graceful fallback.
 """
 
+import atexit
 import os
+import queue
 import smtplib
+import threading
+import time
 from email.mime.text import MIMEText
+from functools import lru_cache
 from typing import Optional
 
 import httpx
 
 
+# Shared HTTP client: alerts often fire in bursts, and a fresh client per
+# call pays a TCP+TLS handshake each time. Lazily created so importing the
+# module never opens sockets.
+_http_client: Optional[httpx.Client] = None
+_http_client_lock = threading.Lock()
+
+
+def _get_http_client() -> httpx.Client:
+    """Get the shared httpx.Client, creating it on first use."""
+    global _http_client
+
+    if _http_client is None:
+        with _http_client_lock:
+            if _http_client is None:
+                _http_client = httpx.Client(
+                    timeout=30.0,
+                    limits=httpx.Limits(max_keepalive_connections=4),
+                )
+                atexit.register(_http_client.close)
+
+    return _http_client
+
+
+_SEVERITY_PREFIXES = {
+    "CRITICAL": "[CRITICAL]",
+    "WARNING": "[WARNING]",
+    "INFO": "[INFO]",
+}
+
+
 def _get_severity_prefix(severity: str) -> str:
     """Get prefix for alert severity."""
-    prefixes = {
-        "CRITICAL": "[CRITICAL]",
-        "WARNING": "[WARNING]",
-        "INFO": "[INFO]",
-    }
-    return prefixes.get(severity.upper(), "[INFO]")
+    return _SEVERITY_PREFIXES.get(severity.upper(), "[INFO]")
 
 
-def _get_config():
-    """Try to get config from config loader, fallback to env vars."""
+@lru_cache(maxsize=1)
+def _resolve_config_loader():
+    """Resolve the config loader once; None if the module is unavailable."""
     try:
         from src.config.loader import get_config
 
-        config = get_config()
-        return config
+        return get_config
     except (ImportError, ModuleNotFoundError):
         return None
 
 
+def _get_config():
+    """Try to get config from config loader, fallback to env vars.
+
+    Only the import resolution is cached here - get_config itself is
+    cached upstream, so reload_config() still takes effect.
+    """
+    loader = _resolve_config_loader()
+    return loader() if loader is not None else None
+
+
 def send_telegram_alert(
     subject: str,
     body: str,
@@ -65,6 +105,11 @@ def send_telegram_alert(
         if not bot_token or not chat_id:
             return False
 
+        # Truncate client-side: Telegram rejects messages over 4096 chars,
+        # which would burn a failed round-trip before the email fallback
+        if len(body) > 4000:
+            body = body[:3997] + "..."
+
         # Format message with severity prefix
         prefix = _get_severity_prefix(severity)
         message = f"{prefix} {subject}\n\n{body}"
@@ -74,12 +119,14 @@ def send_telegram_alert(
         payload = {
             "chat_id": chat_id,
             "text": message,
-            "parse_mode": "Markdown",
         }
+        # Only ask for Markdown parsing when markers are present; plain
+        # alerts skip the server-side parse (and its rejection cases)
+        if any(c in message for c in "*_`["):
+            payload["parse_mode"] = "Markdown"
 
-        with httpx.Client(timeout=30.0) as client:
-            response = client.post(url, json=payload)
-            response.raise_for_status()
+        response = _get_http_client().post(url, json=payload)
+        response.raise_for_status()
 
         return True
 
@@ -155,13 +202,15 @@ def send_email_alert(
         return False
 
 
-def send_alert(
+def _deliver_alert(
     subject: str,
     body: str,
     severity: str = "INFO",
 ) -> bool:
     """
-    Send alert via primary channel (Telegram) with email fallback.
+    Deliver an alert via primary channel (Telegram) with email fallback.
+
+    Runs on the dispatcher thread; callers should use send_alert instead.
 
     Args:
         subject: Alert subject/title
@@ -200,3 +249,95 @@ def send_alert(
     # Both channels failed
     print(f"WARNING: Failed to send alert via any channel: {subject}", file=sys.stderr)
     return False
+
+
+# Delivery queue: send_alert enqueues and returns immediately so the ETL
+# pipeline never blocks on the 30s Telegram/SMTP timeouts. A single daemon
+# thread drains the queue and runs the Telegram-then-email fallback.
+_alert_queue: queue.Queue = queue.Queue(maxsize=256)
+_dispatcher_thread: Optional[threading.Thread] = None
+_dispatcher_lock = threading.Lock()
+
+
+def _dispatch_alerts() -> None:
+    """Drain the alert queue, delivering each alert in order."""
+    while True:
+        subject, body, severity = _alert_queue.get()
+        try:
+            _deliver_alert(subject, body, severity)
+        except Exception:
+            pass  # Delivery failures are already reported by _deliver_alert
+        finally:
+            _alert_queue.task_done()
+
+
+def _ensure_dispatcher() -> None:
+    """Start the dispatcher thread on first use."""
+    global _dispatcher_thread
+
+    if _dispatcher_thread is None or not _dispatcher_thread.is_alive():
+        with _dispatcher_lock:
+            if _dispatcher_thread is None or not _dispatcher_thread.is_alive():
+                _dispatcher_thread = threading.Thread(
+                    target=_dispatch_alerts,
+                    name="alert-dispatcher",
+                    daemon=True,
+                )
+                _dispatcher_thread.start()
+
+
+def send_alert(
+    subject: str,
+    body: str,
+    severity: str = "INFO",
+) -> bool:
+    """
+    Queue an alert for delivery via Telegram with email fallback.
+
+    Returns as soon as the alert is enqueued; a background thread performs
+    the actual network I/O, so callers on the ETL critical path never wait
+    out the channel timeouts. Call flush_alerts() before process exit to
+    wait for in-flight deliveries.
+
+    Args:
+        subject: Alert subject/title
+        body: Alert message body
+        severity: Alert severity level (CRITICAL, WARNING, INFO)
+
+    Returns:
+        True if the alert was enqueued, False if the queue was full
+    """
+    import sys
+
+    _ensure_dispatcher()
+
+    try:
+        _alert_queue.put_nowait((subject, body, severity))
+    except queue.Full:
+        print(
+            f"WARNING: Alert queue full, dropping alert: {subject}",
+            file=sys.stderr,
+        )
+        return False
+
+    return True
+
+
+def flush_alerts(timeout: float = 60.0) -> bool:
+    """
+    Wait for all queued alerts to be delivered.
+
+    Args:
+        timeout: Maximum seconds to wait
+
+    Returns:
+        True if the queue drained within the timeout, False otherwise
+    """
+    deadline = time.monotonic() + timeout
+
+    while _alert_queue.unfinished_tasks:
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(0.05)
+
+    return True
@@ -14,15 +14,26 @@ Functions:
 """
 
 import hashlib
+import importlib.metadata
 import json
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from sqlalchemy.orm import Session
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Batches above this size hash across a process pool; below it the
+# fork/pickle overhead outweighs the parallel SHA256 throughput
+_HASH_PARALLEL_THRESHOLD = 10_000
+
 from src.loader.database import get_session
 from src.loader.db_models import DataLineage
 from src.monitor.logger import logger
@@ -33,16 +44,24 @@ def get_pipeline_version() -> str:
     """Get the current projetus package version.
 
     Returns:
-        Version string from pyproject.toml or 'dev' if not found
+        Installed package version, the pyproject.toml version for source
+        checkouts, or 'dev' if neither is available
     """
-    # Try to read from pyproject.toml
+    # Installed package: metadata lookup, no filesystem parse (and
+    # pyproject.toml is not shipped in wheels anyway)
+    try:
+        return importlib.metadata.version("projetus")
+    except importlib.metadata.PackageNotFoundError:
+        pass
+
+    # Source checkout: fall back to pyproject.toml via stdlib tomllib
     pyproject_path = Path(__file__).parent.parent.parent / "pyproject.toml"
 
     if pyproject_path.exists():
-        import tomli
+        import tomllib
 
         with open(pyproject_path, "rb") as f:
-            pyproject = tomli.load(f)
+            pyproject = tomllib.load(f)
             version = pyproject.get("project", {}).get("version", "dev")
             if version:
                 return version
@@ -50,6 +69,23 @@ def get_pipeline_version() -> str:
     return "dev"
 
 
+def entity_type_from_filename(source_file: str) -> str:
+    """Derive an entity type from a source file name.
+
+    Files follow the {entity_type}_{timestamp}.{ext} convention; the
+    parsing stays on C string methods (no PurePath allocation) and lives
+    here so lineage and reconciliation agree on the rule.
+
+    Args:
+        source_file: Path or name of the source file
+
+    Returns:
+        Lowercased entity type prefix of the file name
+    """
+    base = source_file.rsplit("/", 1)[-1].rsplit("\\", 1)[-1]
+    return base.partition("_")[0].partition(".")[0].lower()
+
+
 def compute_record_hash(record: dict) -> str:
     """Compute SHA256 hash of a record for integrity verification.
 
@@ -58,10 +94,20 @@ def compute_record_hash(record: dict) -> str:
 
     Returns:
         Hexadecimal string of the SHA256 hash
+
+    Note:
+        orjson and stdlib json serialize differently (separators), so an
+        environment must stick with one backend for hashes to stay
+        comparable across runs.
     """
-    # Sort keys for deterministic hashing
-    sorted_record = json.dumps(record, sort_keys=True, default=str)
-    return hashlib.sha256(sorted_record.encode()).hexdigest()
+    # Sort keys for deterministic hashing. orjson serializes straight to
+    # bytes in C - no intermediate str, no .encode() pass - and this call
+    # dominates record_lineage's CPU time on large batches
+    if orjson is not None:
+        payload = orjson.dumps(record, option=orjson.OPT_SORT_KEYS, default=str)
+    else:
+        payload = json.dumps(record, sort_keys=True, default=str).encode()
+    return hashlib.sha256(payload).hexdigest()
 
 
 def record_lineage(
@@ -97,77 +143,90 @@ def record_lineage(
             entity_type = records[0]["_entity_type"]
         else:
             # Extract from source_file name
-            entity_type = Path(source_file).stem.split("_")[0].lower()
-
-    lineage_records = []
-    entity_id_field = None
+            entity_type = entity_type_from_filename(source_file)
 
     # Determine entity_id field based on entity_type
-    if entity_type == "proposta":
-        entity_id_field = "transfer_gov_id"
-    elif entity_type == "apoiador":
-        entity_id_field = "transfer_gov_id"
-    elif entity_type == "emenda":
-        entity_id_field = "transfer_gov_id"
-    elif entity_type == "programa":
+    if entity_type in ("proposta", "apoiador", "emenda", "programa"):
         entity_id_field = "transfer_gov_id"
     else:
         # Default to id or transfer_gov_id
         entity_id_field = "transfer_gov_id" if "transfer_gov_id" in records[0] else "id"
 
-    for record in records:
-        # Extract entity_id
-        entity_id = record.get(entity_id_field) or record.get("id")
-        if not entity_id:
-            logger.warning(
-                f"Record missing entity_id field ({entity_id_field}), skipping"
-            )
-            continue
-
-        # Compute record hash for integrity
-        record_hash = compute_record_hash(record)
-
-        lineage_record = DataLineage(
-            entity_type=entity_type,
-            entity_id=str(entity_id),
-            source_file=source_file,
-            extraction_date=extraction_date,
-            pipeline_version=pipeline_version,
-            record_hash=record_hash,
+    # Columnar pass: ids and hashes come out of list comprehensions (tight
+    # C-level loops) instead of one interpreted loop doing both per record
+    entity_ids = [record.get(entity_id_field) or record.get("id") for record in records]
+    skipped = sum(1 for entity_id in entity_ids if not entity_id)
+    if skipped:
+        logger.warning(
+            f"Skipping {skipped} records missing entity_id field ({entity_id_field})"
         )
-        lineage_records.append(lineage_record)
 
-    # Bulk insert
+    kept = [
+        (record, entity_id)
+        for record, entity_id in zip(records, entity_ids)
+        if entity_id
+    ]
+
+    # SHA256 over serialized records is CPU-bound and GIL-held, so big
+    # batches shard across processes; small ones stay serial to avoid
+    # paying worker startup for less work than it costs
+    if len(kept) > _HASH_PARALLEL_THRESHOLD:
+        with ProcessPoolExecutor() as executor:
+            hashes = list(
+                executor.map(
+                    compute_record_hash,
+                    (record for record, _ in kept),
+                    chunksize=1024,
+                )
+            )
+    else:
+        hashes = [compute_record_hash(record) for record, _ in kept]
+
+    lineage_mappings = [
+        {
+            "entity_type": entity_type,
+            "entity_id": str(entity_id),
+            "source_file": source_file,
+            "extraction_date": extraction_date,
+            "pipeline_version": pipeline_version,
+            "record_hash": record_hash,
+        }
+        for (_, entity_id), record_hash in zip(kept, hashes)
+    ]
+
+    # Bulk insert via Core: executemany with dict mappings engages
+    # insertmanyvalues (multi-row INSERT pages, sized on the engine)
+    # instead of one ORM unit-of-work flush per object
     with get_session() as session:
-        session.add_all(lineage_records)
+        if lineage_mappings:
+            session.execute(insert(DataLineage), lineage_mappings)
         session.commit()
 
-    inserted_count = len(lineage_records)
+    inserted_count = len(lineage_mappings)
     logger.info(f"Recorded lineage for {inserted_count} {entity_type} records")
 
     return inserted_count
 
 
-def query_lineage(source_file: str) -> list[dict]:
+def query_lineage(source_file: str) -> Iterator[dict]:
     """Query all lineage records for a specific source file.
 
     Args:
         source_file: Path or name of the source file
 
-    Returns:
-        List of dictionaries with lineage information
+    Yields:
+        Dictionaries with lineage information, streamed in server-side
+        chunks of 1000 instead of materializing the full result set
     """
     with get_session() as session:
-        results = (
-            session.execute(
-                select(DataLineage).where(DataLineage.source_file == source_file)
-            )
-            .scalars()
-            .all()
+        results = session.scalars(
+            select(DataLineage)
+            .where(DataLineage.source_file == source_file)
+            .execution_options(yield_per=1000)
         )
 
-        return [
-            {
+        for r in results:
+            yield {
                 "entity_type": r.entity_type,
                 "entity_id": r.entity_id,
                 "source_file": r.source_file,
@@ -177,11 +236,9 @@ def query_lineage(source_file: str) -> list[dict]:
                 "pipeline_version": r.pipeline_version,
                 "record_hash": r.record_hash,
             }
-            for r in results
-        ]
 
 
-def query_lineage_by_entity(entity_type: str, entity_id: str) -> list[dict]:
+def query_lineage_by_entity(entity_type: str, entity_id: str) -> Iterator[dict]:
     """Query all lineage records for a specific entity.
 
     Useful for audit trails and tracing data provenance.
@@ -190,23 +247,22 @@ def query_lineage_by_entity(entity_type: str, entity_id: str) -> list[dict]:
         entity_type: Type of entity ('proposta', 'apoiador', etc.)
         entity_id: The entity's identifier
 
-    Returns:
-        List of dictionaries with lineage information for each extraction
+    Yields:
+        Dictionaries with lineage information for each extraction,
+        streamed in server-side chunks of 1000
     """
     with get_session() as session:
-        results = (
-            session.execute(
-                select(DataLineage).where(
-                    DataLineage.entity_type == entity_type,
-                    DataLineage.entity_id == entity_id,
-                )
+        results = session.scalars(
+            select(DataLineage)
+            .where(
+                DataLineage.entity_type == entity_type,
+                DataLineage.entity_id == entity_id,
             )
-            .scalars()
-            .all()
+            .execution_options(yield_per=1000)
         )
 
-        return [
-            {
+        for r in results:
+            yield {
                 "entity_type": r.entity_type,
                 "entity_id": r.entity_id,
                 "source_file": r.source_file,
@@ -217,8 +273,6 @@ def query_lineage_by_entity(entity_type: str, entity_id: str) -> list[dict]:
                 "record_hash": r.record_hash,
                 "created_at": r.created_at.isoformat() if r.created_at else None,
             }
-            for r in results
-        ]
 
 
 def get_entity_lineage_summary(entity_type: str, entity_id: str) -> dict:
@@ -231,37 +285,35 @@ def get_entity_lineage_summary(entity_type: str, entity_id: str) -> dict:
     Returns:
         Summary dictionary with extraction history
     """
-    lineage_records = query_lineage_by_entity(entity_type, entity_id)
-
-    if not lineage_records:
-        return {
-            "entity_type": entity_type,
-            "entity_id": entity_id,
-            "extraction_count": 0,
-            "first_extraction": None,
-            "last_extraction": None,
-            "pipeline_versions": [],
-            "source_files": [],
-        }
-
-    extraction_dates = [
-        datetime.fromisoformat(r["extraction_date"])
-        for r in lineage_records
-        if r["extraction_date"]
-    ]
+    # Single pass over the streamed records: count, min/max, and the two
+    # distinct-value sets accumulate together, so nothing is materialized.
+    # extraction_date stays an ISO-8601 string throughout - record_lineage
+    # writes uniform datetimes, and uniform ISO strings sort
+    # lexicographically, so no fromisoformat round-trip is needed
+    count = 0
+    first_extraction: Optional[str] = None
+    last_extraction: Optional[str] = None
+    versions: set[str] = set()
+    source_files: set[str] = set()
+
+    for r in query_lineage_by_entity(entity_type, entity_id):
+        count += 1
+        extraction_date = r["extraction_date"]
+        if extraction_date:
+            if first_extraction is None or extraction_date < first_extraction:
+                first_extraction = extraction_date
+            if last_extraction is None or extraction_date > last_extraction:
+                last_extraction = extraction_date
+        if r["pipeline_version"]:
+            versions.add(r["pipeline_version"])
+        source_files.add(r["source_file"])
 
     return {
         "entity_type": entity_type,
         "entity_id": entity_id,
-        "extraction_count": len(lineage_records),
-        "first_extraction": min(extraction_dates).isoformat()
-        if extraction_dates
-        else None,
-        "last_extraction": max(extraction_dates).isoformat()
-        if extraction_dates
-        else None,
-        "pipeline_versions": list(
-            set(r["pipeline_version"] for r in lineage_records if r["pipeline_version"])
-        ),
-        "source_files": list(set(r["source_file"] for r in lineage_records)),
+        "extraction_count": count,
+        "first_extraction": first_extraction,
+        "last_extraction": last_extraction,
+        "pipeline_versions": list(versions),
+        "source_files": list(source_files),
     }
@@ -16,4 +16,5 @@ def configure_logging():
         compression="zip",
         level="DEBUG",
         diagnose=False,  # Don't expose variables in production
+        enqueue=True,  # Serialization/IO on a background thread, not the caller
     )
@@ -9,6 +9,7 @@ Reconciliation Results:
 - get_reconciliation_summary: Human-readable summary of results
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -26,7 +27,8 @@ from src.loader.db_models import (
     Programa,
     Proposta,
 )
-from src.monitor.alerting import send_alert
+from src.monitor.alerting import flush_alerts, send_alert
+from src.monitor.lineage import entity_type_from_filename
 from src.monitor.logger import logger
 
 # Entity type to model mapping
@@ -54,31 +56,70 @@ class ReconciliationResult:
             self.discrepancy = abs(self.source_count - self.db_count)
 
 
-def reconcile_file(file_path: str, entity_type: str) -> ReconciliationResult:
+def _db_lineage_counts(file_paths: list[str]) -> dict[tuple[str, str], int]:
+    """Fetch lineage counts for a set of source files in one query.
+
+    Args:
+        file_paths: Source file paths to count records for
+
+    Returns:
+        Dict mapping (source_file, entity_type) to its record count
+    """
+    with get_session() as session:
+        rows = session.execute(
+            select(
+                DataLineage.source_file,
+                DataLineage.entity_type,
+                func.count(DataLineage.id),
+            )
+            .where(DataLineage.source_file.in_(file_paths))
+            .group_by(DataLineage.source_file, DataLineage.entity_type)
+        ).all()
+
+    return {(source_file, entity_type): count for source_file, entity_type, count in rows}
+
+
+def reconcile_file(
+    file_path: str,
+    entity_type: str,
+    db_counts: Optional[dict[tuple[str, str], int]] = None,
+) -> ReconciliationResult:
     """Compare source file row count with database inserts for a single file.
 
     Args:
         file_path: Path to the source file (Parquet format)
         entity_type: Entity type ('proposta', 'apoiador', 'emenda', 'programa')
+        db_counts: Optional precomputed (source_file, entity_type) → count
+            map from _db_lineage_counts; standalone calls query per file
 
     Returns:
         ReconciliationResult with counts and match status
     """
     logger.debug(f"Reconciling {file_path} for {entity_type}")
 
-    # Count rows in source file using Polars
-    source_df = pl.read_parquet(file_path)
-    source_count = len(source_df)
+    # Row count straight from the Parquet footer: reads kilobytes of
+    # metadata instead of decompressing every column chunk
+    try:
+        import pyarrow.parquet as pq
+
+        source_count = pq.ParquetFile(file_path).metadata.num_rows
+    except ImportError:
+        # Lazy scan also answers pl.len() from metadata, no full read
+        source_count = pl.scan_parquet(file_path).select(pl.len()).collect().item()
     logger.debug(f"Source file has {source_count} rows")
 
-    # Query DB count for this entity from this source_file
-    with get_session() as session:
-        db_count = session.execute(
-            select(func.count(DataLineage.id)).where(
-                DataLineage.source_file == file_path,
-                DataLineage.entity_type == entity_type,
-            )
-        ).scalar_one()
+    # DB count: from the sweep's single grouped query when available,
+    # otherwise one lookup for this file
+    if db_counts is not None:
+        db_count = db_counts.get((file_path, entity_type), 0)
+    else:
+        with get_session() as session:
+            db_count = session.execute(
+                select(func.count(DataLineage.id)).where(
+                    DataLineage.source_file == file_path,
+                    DataLineage.entity_type == entity_type,
+                )
+            ).scalar_one()
 
     logger.debug(f"Database has {db_count} records for this source file")
 
@@ -100,6 +141,54 @@ def reconcile_file(file_path: str, entity_type: str) -> ReconciliationResult:
     return result
 
 
+def _safe_reconcile(
+    file_path: Path,
+    entity_type: str,
+    alert_on_mismatch: bool,
+    db_counts: Optional[dict[tuple[str, str], int]] = None,
+) -> ReconciliationResult:
+    """Reconcile one file, converting failures into error-marked results.
+
+    Worker for run_reconciliation's thread pool: also dispatches the
+    mismatch alert (send_alert only enqueues, so this never blocks the
+    pool on channel timeouts).
+
+    Args:
+        file_path: Path to the source Parquet file
+        entity_type: Entity type inferred from the filename
+        alert_on_mismatch: Whether to send an alert when counts differ
+        db_counts: Precomputed lineage counts from _db_lineage_counts
+
+    Returns:
+        ReconciliationResult; source/db counts of -1 signal a failure
+    """
+    try:
+        result = reconcile_file(str(file_path), entity_type, db_counts)
+    except Exception as e:
+        logger.error(f"Error reconciling {file_path}: {e}")
+        return ReconciliationResult(
+            file_path=str(file_path),
+            entity_type=entity_type,
+            source_count=-1,
+            db_count=-1,
+            match=False,
+        )
+
+    if not result.match and alert_on_mismatch:
+        send_alert(
+            "Data Reconciliation Mismatch",
+            (
+                f"Mismatch detected in {file_path.name}:\n"
+                f"  Source rows: {result.source_count}\n"
+                f"  DB records: {result.db_count}\n"
+                f"  Difference: {result.discrepancy}"
+            ),
+            severity="WARNING",
+        )
+
+    return result
+
+
 def run_reconciliation(
     raw_data_dir: Optional[Path] = None, date_filter: Optional[str] = None
 ) -> list[ReconciliationResult]:
@@ -128,49 +217,41 @@ def run_reconciliation(
     parquet_files = list(raw_data_dir.glob(pattern))
     logger.info(f"Found {len(parquet_files)} parquet files to reconcile")
 
+    # Infer entity_type from filename
+    # Expected format: {entity_type}_{timestamp}.parquet
+    tasks: list[tuple[Path, str]] = []
     for file_path in sorted(parquet_files):
-        # Infer entity_type from filename
-        # Expected format: {entity_type}_{timestamp}.parquet
-        filename = file_path.stem
-        parts = filename.split("_")
-
-        if len(parts) >= 1:
-            entity_type = parts[0].lower()
+        entity_type = entity_type_from_filename(file_path.name)
 
-            if entity_type not in ENTITY_MODEL_MAP:
-                logger.warning(
-                    f"Unknown entity type '{entity_type}' in {file_path}, skipping"
-                )
-                continue
-
-            try:
-                result = reconcile_file(str(file_path), entity_type)
-                results.append(result)
-
-                # Alert on mismatch if configured
-                if not result.match and settings.alert_on_mismatch:
-                    send_alert(
-                        title="Data Reconciliation Mismatch",
-                        message=(
-                            f"Mismatch detected in {file_path.name}:\n"
-                            f"  Source rows: {result.source_count}\n"
-                            f"  DB records: {result.db_count}\n"
-                            f"  Difference: {result.discrepancy}"
-                        ),
-                    )
-
-            except Exception as e:
-                logger.error(f"Error reconciling {file_path}: {e}")
-                # Still add a result indicating failure
-                results.append(
-                    ReconciliationResult(
-                        file_path=str(file_path),
-                        entity_type=entity_type,
-                        source_count=-1,
-                        db_count=-1,
-                        match=False,
-                    )
+        if entity_type not in ENTITY_MODEL_MAP:
+            logger.warning(
+                f"Unknown entity type '{entity_type}' in {file_path}, skipping"
+            )
+            continue
+
+        tasks.append((file_path, entity_type))
+
+    if tasks:
+        # One grouped query replaces a COUNT round-trip per file, so the
+        # workers below only touch the filesystem
+        db_counts = _db_lineage_counts([str(path) for path, _ in tasks])
+
+        # Footer reads are independent I/O - overlap them across threads;
+        # map() preserves the sorted input order
+        with ThreadPoolExecutor(max_workers=min(8, len(tasks))) as executor:
+            results = list(
+                executor.map(
+                    lambda task: _safe_reconcile(
+                        *task, settings.alert_on_mismatch, db_counts
+                    ),
+                    tasks,
                 )
+            )
+
+        # send_alert only enqueues onto the daemon dispatcher thread; this
+        # is a one-shot entry point, so drain the queue before returning or
+        # mismatch alerts are dropped at interpreter exit
+        flush_alerts()
 
     logger.info(
         f"Reconciliation complete: {len(results)} files processed, "
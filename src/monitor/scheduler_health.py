@@ -5,18 +5,21 @@ Monitors extraction scheduler and alerts when runs are missed or delayed.
 """
 
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Optional
 
-from sqlalchemy.orm import Session, sessionmaker
-
-from src.loader.database import get_engine
+from src.loader.database import get_session
 from src.loader.extraction_log import get_last_extraction
 from src.loader.db_models import ExtractionLog
 
 
+@lru_cache(maxsize=1)
 def _get_extraction_hour() -> int:
     """Get expected extraction hour from config or use default.
 
+    Cached for the process lifetime (health probes call this per check);
+    config-reload paths can call .cache_clear().
+
     Returns:
         Expected extraction hour (default 9 for 9 AM).
     """
@@ -82,8 +85,7 @@ def get_scheduler_status() -> dict:
     expected_hour = _get_extraction_hour()
 
     # Get last extraction
-    SessionLocal = sessionmaker(bind=get_engine())
-    with SessionLocal() as session:
+    with get_session() as session:
         last_extraction = get_last_extraction(session)
 
     # Determine status
@@ -155,8 +157,7 @@ def check_scheduler_health(
         - is_healthy=False, message="..." if scheduler miss detected
     """
     # Get last extraction
-    SessionLocal = sessionmaker(bind=get_engine())
-    with SessionLocal() as session:
+    with get_session() as session:
         last_extraction = get_last_extraction(session)
 
     # Calculate time boundaries
@@ -4,38 +4,60 @@ Volume anomaly detection for PROJETUS ETL pipeline.
 Monitors extraction volume and alerts when counts differ significantly from previous runs.
 """
 
+import time
+from functools import lru_cache
 from typing import Optional
 
 from sqlalchemy import text
-from sqlalchemy.orm import Session, sessionmaker
 
-from src.loader.database import get_engine
+from src.loader.database import get_engine, get_session
 from src.loader.extraction_log import get_last_extraction
 
 
+# COUNT(*) is a full scan per table; under frequent polling the counts
+# are cached for a short window so concurrent checks share one sweep
+_COUNTS_TTL_SECONDS = 60.0
+_counts_cache: Optional[tuple[float, dict[str, int]]] = None
+
+
 def _get_entity_counts() -> dict[str, int]:
     """Get current counts for each entity type from the database.
 
+    Counts are cached for 60 seconds - volume checks tolerate slightly
+    stale numbers, and this keeps repeated health probes from issuing
+    full-table scans back to back.
+
     Returns:
         Dictionary mapping entity names to their record counts.
     """
-    counts = {}
+    global _counts_cache
 
-    with get_engine().connect() as conn:
-        # Count each entity type
-        tables = ["programas", "propostas", "apoiadores", "emendas"]
+    now = time.monotonic()
+    if _counts_cache is not None and now - _counts_cache[0] < _COUNTS_TTL_SECONDS:
+        return _counts_cache[1]
 
-        for table in tables:
-            result = conn.execute(text(f"SELECT COUNT(*) FROM {table}"))
-            count = result.scalar()
-            counts[table] = count
+    tables = ["programas", "propostas", "apoiadores", "emendas"]
+
+    # One UNION ALL statement instead of four round-trips; table names
+    # come from the hard-coded list above, not user input
+    union_sql = " UNION ALL ".join(
+        f"SELECT '{table}' AS t, COUNT(*) AS c FROM {table}" for table in tables
+    )
+
+    with get_engine().connect() as conn:
+        counts = {t: c for t, c in conn.execute(text(union_sql)).all()}
 
+    _counts_cache = (now, counts)
     return counts
 
 
+@lru_cache(maxsize=1)
 def _get_tolerance_percent() -> int:
     """Get tolerance percentage from config or use default.
 
+    Cached for the process lifetime (volume checks run per extraction);
+    config-reload paths can call .cache_clear().
+
     Returns:
         Tolerance percentage (default 10%).
     """
@@ -67,17 +89,16 @@ def should_alert_volume(
         # No previous data - don't alert on first run
         return False
 
-    for entity in current:
-        if entity in previous and previous[entity] > 0:
-            current_count = current[entity]
-            previous_count = previous[entity]
-
-            change_percent = abs(current_count - previous_count) / previous_count * 100
-
-            if change_percent > tolerance_percent:
-                return True
-
-    return False
+    # |curr - prev| / prev * 100 > tol, rearranged to
+    # |curr - prev| * 100 > tol * prev: pure integer arithmetic on counts,
+    # no FP division or rounding at the threshold boundary. any() stops at
+    # the first breach
+    return any(
+        abs(current[entity] - previous[entity]) * 100
+        > tolerance_percent * previous[entity]
+        for entity in current
+        if previous.get(entity, 0) > 0
+    )
 
 
 def get_volume_alert_message(
@@ -149,11 +170,7 @@ def check_volume_anomaly(
         current_counts = _get_entity_counts()
 
     # Get previous extraction
-    from sqlalchemy.orm import Session
-    from src.loader.database import get_engine
-
-    SessionLocal = sessionmaker(bind=get_engine())
-    with SessionLocal() as session:
+    with get_session() as session:
         last_extraction = get_last_extraction(session)
 
     # Get tolerance from config
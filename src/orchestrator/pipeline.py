@@ -5,7 +5,9 @@ process: parsing files, validating data, and loading into the database.
 """
 
 import hashlib
+import os
 import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date
 from pathlib import Path
 from typing import Optional
@@ -119,99 +121,279 @@ def extract_relationships(
         logger.warning("Could not find proposta ID column in relationship CSV")
         return
 
-    seen_apoiadores: dict[str, dict] = {}
-    seen_emendas: dict[str, dict] = {}
-    junction_apoiadores: set[tuple[str, str]] = set()
-    junction_emendas: set[tuple[str, str]] = set()
-    # Track emenda stats by CNPJ (for proponente aggregation)
+    # Normalize once into a narrow frame: every downstream dedup/aggregation
+    # runs on these vectorized columns instead of per-row Python str() calls.
+    # Missing columns become all-null so the expressions below stay uniform.
+    def _text(col: Optional[str], alias: str) -> pl.Expr:
+        if col:
+            return pl.col(col).cast(pl.Utf8).str.strip_chars().alias(alias)
+        return pl.lit(None, dtype=pl.Utf8).alias(alias)
+
+    valor_expr = (
+        pl.col(valor_col).cast(pl.Float64, strict=False)
+        if valor_col
+        else pl.lit(None, dtype=pl.Float64)
+    ).alias("valor")
+
+    base = (
+        raw_df.lazy()
+        .select(
+            _text(proposta_col, "proposta_id"),
+            _text(programa_col, "prog_id"),
+            _text(parlamentar_col, "nome"),
+            _text(tipo_col, "tipo"),
+            _text(orgao_col, "orgao"),
+            _text(emenda_num_col, "numero"),
+            valor_expr,
+            _text(cnpj_col, "cnpj"),
+        )
+        .filter(pl.col("proposta_id").is_not_null() & (pl.col("proposta_id") != ""))
+        .collect(engine="streaming")
+    )
+
+    n_apoiadores = n_emendas = n_junction_apoiadores = n_junction_emendas = 0
+
+    # Programa links: last occurrence wins, mirroring the dict-assignment
+    # semantics of the old loop
+    if programa_col:
+        links = base.filter(
+            pl.col("prog_id").is_not_null() & (pl.col("prog_id") != "")
+        ).unique(subset=["proposta_id"], keep="last", maintain_order=True)
+        programa_links.update(zip(links["proposta_id"], links["prog_id"]))
+
+    # Apoiadores: dedupe by nome (first occurrence supplies tipo/orgao),
+    # then hash only the unique names - SHA-256 stays as the ID scheme
+    # because transfer_gov_id is the persisted upsert key
+    if parlamentar_col:
+        apoiador_rows = base.filter(
+            pl.col("nome").is_not_null() & (pl.col("nome") != "")
+        )
+        apoiadores_df = (
+            apoiador_rows.unique(subset=["nome"], keep="first", maintain_order=True)
+            .select("nome", "tipo", "orgao")
+            .with_columns(
+                pl.col("nome")
+                .map_elements(
+                    lambda nome: hashlib.sha256(nome.encode()).hexdigest()[:16],
+                    return_dtype=pl.Utf8,
+                )
+                .alias("transfer_gov_id")
+            )
+        )
+        validated_data["apoiadores"].extend(
+            apoiadores_df.select("transfer_gov_id", "nome", "tipo", "orgao").to_dicts()
+        )
+        junction_apoiadores = (
+            apoiador_rows.select("proposta_id", "nome")
+            .unique()
+            .join(apoiadores_df.select("nome", "transfer_gov_id"), on="nome")
+            .select(
+                pl.col("proposta_id").alias("proposta_transfer_gov_id"),
+                pl.col("transfer_gov_id").alias("apoiador_transfer_gov_id"),
+            )
+        )
+        validated_data["proposta_apoiadores"].extend(junction_apoiadores.to_dicts())
+        n_apoiadores = len(apoiadores_df)
+        n_junction_apoiadores = len(junction_apoiadores)
+
+    # Emendas: numero_emenda is already unique, so it doubles as the ID
     cnpj_emenda_stats: dict[str, dict] = {}  # cnpj → {count, total_valor}
+    if emenda_num_col:
+        emenda_rows = base.filter(
+            pl.col("numero").is_not_null() & (pl.col("numero") != "")
+        )
+        emendas_df = emenda_rows.unique(
+            subset=["numero"], keep="first", maintain_order=True
+        ).select(
+            pl.col("numero").alias("transfer_gov_id"),
+            "numero",
+            pl.col("nome").alias("autor"),
+            "valor",
+            "tipo",
+            pl.lit(None, dtype=pl.Int64).alias("ano"),
+        )
+        validated_data["emendas"].extend(emendas_df.to_dicts())
 
-    for row in raw_df.iter_rows(named=True):
-        proposta_id = str(row.get(proposta_col, "")).strip()
-        if not proposta_id:
-            continue
-
-        # Extract programa link
-        if programa_col:
-            prog_id = str(row.get(programa_col, "")).strip()
-            if prog_id:
-                programa_links[proposta_id] = prog_id
-
-        # Extract apoiador
-        if parlamentar_col:
-            nome = str(row.get(parlamentar_col, "")).strip()
-            if nome:
-                # Use hash of nome as transfer_gov_id for apoiador
-                apoiador_id = hashlib.sha256(nome.encode()).hexdigest()[:16]
-                if apoiador_id not in seen_apoiadores:
-                    seen_apoiadores[apoiador_id] = {
-                        "transfer_gov_id": apoiador_id,
-                        "nome": nome,
-                        "tipo": str(row.get(tipo_col, "")).strip() if tipo_col else None,
-                        "orgao": str(row.get(orgao_col, "")).strip() if orgao_col else None,
-                    }
-                junction_apoiadores.add((proposta_id, apoiador_id))
-
-        # Extract emenda
-        if emenda_num_col:
-            numero = str(row.get(emenda_num_col, "")).strip()
-            if numero:
-                emenda_id = numero  # numero_emenda is already unique
-                valor_raw = row.get(valor_col) if valor_col else None
-                valor = None
-                if valor_raw is not None:
-                    try:
-                        valor = float(valor_raw)
-                    except (ValueError, TypeError):
-                        pass
-
-                if emenda_id not in seen_emendas:
-                    autor = str(row.get(parlamentar_col, "")).strip() if parlamentar_col else None
-                    tipo = str(row.get(tipo_col, "")).strip() if tipo_col else None
-                    seen_emendas[emenda_id] = {
-                        "transfer_gov_id": emenda_id,
-                        "numero": numero,
-                        "autor": autor,
-                        "valor": valor,
-                        "tipo": tipo,
-                        "ano": None,
-                    }
-                junction_emendas.add((proposta_id, emenda_id))
-
-                # Aggregate emenda stats by CNPJ
-                if cnpj_col:
-                    cnpj = str(row.get(cnpj_col, "")).strip()
-                    if cnpj:
-                        if cnpj not in cnpj_emenda_stats:
-                            cnpj_emenda_stats[cnpj] = {"count": 0, "total_valor": 0.0}
-                        cnpj_emenda_stats[cnpj]["count"] += 1
-                        if valor:
-                            cnpj_emenda_stats[cnpj]["total_valor"] += valor
+        junction_emendas = (
+            emenda_rows.select(
+                pl.col("proposta_id").alias("proposta_transfer_gov_id"),
+                pl.col("numero").alias("emenda_transfer_gov_id"),
+            )
+            .unique()
+        )
+        validated_data["proposta_emendas"].extend(junction_emendas.to_dicts())
+        n_emendas = len(emendas_df)
+        n_junction_emendas = len(junction_emendas)
+
+        # Aggregate emenda stats by CNPJ (for proponente aggregation):
+        # one grouped pass replaces the per-row accumulator dict
+        if cnpj_col:
+            stats_df = (
+                emenda_rows.filter(
+                    pl.col("cnpj").is_not_null() & (pl.col("cnpj") != "")
+                )
+                .group_by("cnpj", maintain_order=True)
+                .agg(
+                    pl.len().alias("count"),
+                    pl.col("valor").sum().alias("total_valor"),
+                )
+            )
+            cnpj_emenda_stats = {
+                cnpj: {"count": count, "total_valor": total_valor or 0.0}
+                for cnpj, count, total_valor in stats_df.iter_rows()
+            }
 
     # Store CNPJ emenda stats for proponente aggregation
     validated_data["cnpj_emenda_stats"] = cnpj_emenda_stats
 
-    # Append to validated_data
-    validated_data["apoiadores"].extend(seen_apoiadores.values())
-    validated_data["emendas"].extend(seen_emendas.values())
+    logger.info(
+        f"Extracted relationships: {n_apoiadores} apoiadores, "
+        f"{n_emendas} emendas, {n_junction_apoiadores} proposta_apoiadores, "
+        f"{n_junction_emendas} proposta_emendas, {len(programa_links)} programa links"
+    )
 
-    for proposta_id, apoiador_id in junction_apoiadores:
-        validated_data["proposta_apoiadores"].append({
-            "proposta_transfer_gov_id": proposta_id,
-            "apoiador_transfer_gov_id": apoiador_id,
-        })
 
-    for proposta_id, emenda_id in junction_emendas:
-        validated_data["proposta_emendas"].append({
-            "proposta_transfer_gov_id": proposta_id,
-            "emenda_transfer_gov_id": emenda_id,
-        })
+def _process_file(file_path: str, entity_type: str) -> dict:
+    """Parse and validate a single source file (process-pool worker).
 
-    logger.info(
-        f"Extracted relationships: {len(seen_apoiadores)} apoiadores, "
-        f"{len(seen_emendas)} emendas, {len(junction_apoiadores)} proposta_apoiadores, "
-        f"{len(junction_emendas)} proposta_emendas, {len(programa_links)} programa links"
-    )
+    Runs in a worker process: it only reads the file and returns plain
+    picklable structures. Merging into the shared validated_data and
+    programa_links happens in the parent, in sorted-filename order.
+
+    Args:
+        file_path: Path to the Excel/CSV file
+        entity_type: Entity type inferred from the filename
+
+    Returns:
+        Dict with 'validated' (entity → records), 'programa_links',
+        'cnpj_emenda_stats' (None unless a relationship file), and
+        'errors' (validation error strings)
+    """
+    file_name = Path(file_path).name
+    result: dict = {
+        "validated": {},
+        "programa_links": {},
+        "cnpj_emenda_stats": None,
+        "errors": [],
+    }
+
+    df = parse_file(file_path, entity_type)
+    logger.info(f"Parsed {file_name}: {len(df)} rows")
+
+    if entity_type == "programa_proposta":
+        # programa_proposta CSV: maps ID_PROPOSTA → ID_PROGRAMA
+        id_programa_col = _col(df, "id_programa")
+        id_proposta_col = _col(df, "id_proposta")
+        if id_programa_col and id_proposta_col:
+            links: dict[str, str] = {}
+            for row in df.iter_rows(named=True):
+                prop_id = str(row.get(id_proposta_col, "")).strip()
+                prog_id = str(row.get(id_programa_col, "")).strip()
+                if prop_id and prog_id:
+                    links[prop_id] = prog_id
+            result["programa_links"] = links
+            logger.info(f"Loaded {len(links)} programa_proposta links from {file_name}")
+        else:
+            logger.warning(f"Could not find ID columns in {file_name}")
+        return result
+
+    if entity_type in ("apoiadores", "emendas"):
+        # Relationship CSV: extract entities + junctions from raw data
+        local_data: dict[str, list[dict]] = {
+            "apoiadores": [],
+            "emendas": [],
+            "proposta_apoiadores": [],
+            "proposta_emendas": [],
+        }
+        local_links: dict[str, str] = {}
+        extract_relationships(df, local_data, local_links)
+        result["cnpj_emenda_stats"] = local_data.pop("cnpj_emenda_stats", {})
+        result["validated"] = local_data
+        result["programa_links"] = local_links
+        logger.info(f"Extracted relationships from {file_name}")
+        return result
+
+    # Standard entity: validate and collect
+    valid_records, errors = validate_dataframe(df, entity_type)
+
+    if errors:
+        result["errors"] = [
+            f"{file_name}: {error.get('errors', 'Validation error')}"
+            for error in errors
+        ]
+        logger.warning(f"Validation errors in {file_name}: {len(errors)} errors")
+
+    # FILTER: Only 2025-2026 data and OSCs
+    if entity_type == "propostas":
+        # Get year, natureza_juridica, and ID columns from raw dataframe
+        ano_col = _col(df, "ano_prop")
+        nat_jur_col = _col(df, "natureza_juridica")
+        id_col = _col(df, "id_proposta")
+
+        if ano_col and nat_jur_col and id_col:
+            # Build set of valid IDs (2025-2026 + OSC)
+            valid_ids = set()
+            for row in df.iter_rows(named=True):
+                ano_raw = row.get(ano_col)
+                # Convert ano to int for comparison (may be string from CSV)
+                try:
+                    ano = int(ano_raw) if ano_raw else None
+                except (ValueError, TypeError):
+                    ano = None
+
+                nat_jur = str(row.get(nat_jur_col, "")).strip().lower()
+                record_id = str(row.get(id_col, "")).strip()
+
+                # Filter: year in [2025, 2026] AND natureza_juridica contains "sociedade civil" (OSC)
+                # Use flexible matching to handle encoding issues
+                is_osc = (
+                    "sociedade civil" in nat_jur or
+                    "socieda" in nat_jur or
+                    "osc" in nat_jur or
+                    "organiza" in nat_jur
+                )
+                if ano in (2025, 2026) and is_osc and record_id:
+                    valid_ids.add(record_id)
+
+            # Filter valid_records to only include matching IDs
+            original_count = len(valid_records)
+            valid_records = [
+                record for record in valid_records
+                if record.get("transfer_gov_id") in valid_ids
+            ]
+            logger.info(
+                f"Filtered {file_name}: {original_count} → {len(valid_records)} records (2025-2026 + OSCs only)"
+            )
+
+    result["validated"][entity_type] = valid_records
+    logger.info(f"Validated {file_name}: {len(valid_records)} valid records")
+
+    # Extract proponentes from propostas
+    if entity_type == "propostas" and len(valid_records) > 0:
+        proponentes = extract_proponentes_from_propostas(valid_records, df)
+        result["validated"]["proponentes"] = proponentes
+        logger.info(f"Extracted {len(proponentes)} proponentes from {file_name}")
+
+        # Also add proponente_cnpj to each proposta record
+        cnpj_col = _col(df, "identif_proponente")
+        if cnpj_col:
+            proposta_id_col = _col(df, "id_proposta")
+            # Create CNPJ lookup from raw df
+            cnpj_lookup = {}
+            for row in df.iter_rows(named=True):
+                prop_id = str(row.get(proposta_id_col, "")).strip()
+                cnpj_raw = row.get(cnpj_col, "")
+                cnpj = normalize_cnpj(cnpj_raw)
+                if prop_id and cnpj:
+                    cnpj_lookup[prop_id] = cnpj
+
+            # Add proponente_cnpj to validated records
+            for record in valid_records:
+                prop_id = record.get("transfer_gov_id")
+                if prop_id and prop_id in cnpj_lookup:
+                    record["proponente_cnpj"] = cnpj_lookup[prop_id]
+
+    return result
 
 
 def run_pipeline(config_path: Optional[str] = None) -> None:
@@ -305,134 +487,45 @@ def run_pipeline(config_path: Optional[str] = None) -> None:
         validation_errors = []
         programa_links: dict[str, str] = {}  # proposta_id → programa_id
 
+        tasks: list[tuple[Path, str]] = []
         for file_path in sorted(files):
-            file_name = file_path.name
-            entity_type = infer_entity_type(file_name)
+            entity_type = infer_entity_type(file_path.name)
 
             if entity_type is None:
-                logger.warning(f"Could not determine entity type for: {file_name}")
+                logger.warning(f"Could not determine entity type for: {file_path.name}")
                 continue
 
-            logger.info(f"Processing {file_name} as {entity_type}")
-
-            try:
-                # Parse file
-                df = parse_file(str(file_path), entity_type)
-                logger.info(f"Parsed {file_name}: {len(df)} rows")
-
-                if entity_type == "programa_proposta":
-                    # programa_proposta CSV: maps ID_PROPOSTA → ID_PROGRAMA
-                    id_programa_col = _col(df, "id_programa")
-                    id_proposta_col = _col(df, "id_proposta")
-                    if id_programa_col and id_proposta_col:
-                        for row in df.iter_rows(named=True):
-                            prop_id = str(row.get(id_proposta_col, "")).strip()
-                            prog_id = str(row.get(id_programa_col, "")).strip()
-                            if prop_id and prog_id:
-                                programa_links[prop_id] = prog_id
-                        logger.info(f"Loaded {len(programa_links)} programa_proposta links")
-                    else:
-                        logger.warning(f"Could not find ID columns in {file_name}")
-                    continue
-
-                if entity_type in ("apoiadores", "emendas"):
-                    # Relationship CSV: extract entities + junctions from raw data
-                    extract_relationships(df, validated_data, programa_links)
-                    logger.info(
-                        f"Extracted relationships from {file_name}"
-                    )
-                else:
-                    # Standard entity: validate and collect
-                    valid_records, errors = validate_dataframe(df, entity_type)
-
-                    if errors:
-                        for error in errors:
-                            validation_errors.append(
-                                f"{file_name}: {error.get('errors', 'Validation error')}"
-                            )
-                        logger.warning(
-                            f"Validation errors in {file_name}: {len(errors)} errors"
-                        )
-
-                    # FILTER: Only 2025-2026 data and OSCs
-                    if entity_type == "propostas":
-                        # Get year, natureza_juridica, and ID columns from raw dataframe
-                        ano_col = _col(df, "ano_prop")
-                        nat_jur_col = _col(df, "natureza_juridica")
-                        id_col = _col(df, "id_proposta")
-
-                        if ano_col and nat_jur_col and id_col:
-                            # Build set of valid IDs (2025-2026 + OSC)
-                            valid_ids = set()
-                            for row in df.iter_rows(named=True):
-                                ano_raw = row.get(ano_col)
-                                # Convert ano to int for comparison (may be string from CSV)
-                                try:
-                                    ano = int(ano_raw) if ano_raw else None
-                                except (ValueError, TypeError):
-                                    ano = None
-
-                                nat_jur = str(row.get(nat_jur_col, "")).strip().lower()
-                                record_id = str(row.get(id_col, "")).strip()
-
-                                # Filter: year in [2025, 2026] AND natureza_juridica contains "sociedade civil" (OSC)
-                                # Use flexible matching to handle encoding issues
-                                is_osc = (
-                                    "sociedade civil" in nat_jur or
-                                    "socieda" in nat_jur or
-                                    "osc" in nat_jur or
-                                    "organiza" in nat_jur
-                                )
-                                if ano in (2025, 2026) and is_osc and record_id:
-                                    valid_ids.add(record_id)
-
-                            # Filter valid_records to only include matching IDs
-                            original_count = len(valid_records)
-                            valid_records = [
-                                record for record in valid_records
-                                if record.get("transfer_gov_id") in valid_ids
-                            ]
-                            logger.info(
-                                f"Filtered {file_name}: {original_count} → {len(valid_records)} records (2025-2026 + OSCs only)"
-                            )
-
-                    validated_data[entity_type].extend(valid_records)
-                    logger.info(
-                        f"Validated {file_name}: {len(valid_records)} valid records"
-                    )
-
-                    # Extract proponentes from propostas
-                    if entity_type == "propostas" and len(valid_records) > 0:
-                        proponentes = extract_proponentes_from_propostas(valid_records, df)
-                        validated_data["proponentes"].extend(proponentes)
-                        logger.info(
-                            f"Extracted {len(proponentes)} proponentes from {file_name}"
-                        )
-
-                        # Also add proponente_cnpj to each proposta record
-                        cnpj_col = _col(df, "identif_proponente")
-                        if cnpj_col:
-                            proposta_id_col = _col(df, "id_proposta")
-                            # Create CNPJ lookup from raw df
-                            cnpj_lookup = {}
-                            for row in df.iter_rows(named=True):
-                                prop_id = str(row.get(proposta_id_col, "")).strip()
-                                cnpj_raw = row.get(cnpj_col, "")
-                                cnpj = normalize_cnpj(cnpj_raw)
-                                if prop_id and cnpj:
-                                    cnpj_lookup[prop_id] = cnpj
-
-                            # Add proponente_cnpj to validated records
-                            for record in valid_records:
-                                prop_id = record.get("transfer_gov_id")
-                                if prop_id and prop_id in cnpj_lookup:
-                                    record["proponente_cnpj"] = cnpj_lookup[prop_id]
-
-            except Exception as e:
-                error_msg = f"Error processing {file_name}: {e}"
-                validation_errors.append(error_msg)
-                logger.error(error_msg)
-                # Continue processing other files
+            tasks.append((file_path, entity_type))
+
+        # Parse + validate fan out across processes: XLSX decompression,
+        # CSV parsing, and Pydantic validation are CPU-bound and independent
+        # per file. Workers never touch the inherited engine; results merge
+        # here in sorted-filename order so runs stay deterministic.
+        if tasks:
+            with ProcessPoolExecutor(
+                max_workers=min(len(tasks), os.cpu_count() or 1)
+            ) as pool:
+                futures = [
+                    pool.submit(_process_file, str(file_path), entity_type)
+                    for file_path, entity_type in tasks
+                ]
+                for (file_path, entity_type), future in zip(tasks, futures):
+                    logger.info(f"Processing {file_path.name} as {entity_type}")
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        error_msg = f"Error processing {file_path.name}: {e}"
+                        validation_errors.append(error_msg)
+                        logger.error(error_msg)
+                        # Continue processing other files
+                        continue
+
+                    for key, records in result["validated"].items():
+                        validated_data[key].extend(records)
+                    programa_links.update(result["programa_links"])
+                    if result["cnpj_emenda_stats"] is not None:
+                        validated_data["cnpj_emenda_stats"] = result["cnpj_emenda_stats"]
+                    validation_errors.extend(result["errors"])
 
         # Apply programa_id links to propostas
         if programa_links and validated_data["propostas"]:
@@ -462,7 +555,13 @@ def run_pipeline(config_path: Optional[str] = None) -> None:
         stats = {}
         if total_valid > 0:
             try:
-                stats = load_extraction_data(session, validated_data, extraction_date)
+                # Parent tables load in parallel on their own sessions;
+                # upserts are idempotent so a retried run absorbs any
+                # partially-committed parents
+                stats = load_extraction_data(
+                    session, validated_data, extraction_date,
+                    session_factory=SessionLocal,
+                )
                 logger.info(f"Loaded data: {stats}")
             except Exception as e:
                 session.rollback()
@@ -29,12 +29,13 @@ from src.loader.db_models import (
     Emenda,
     ExtractionLog,
     Programa,
+    Proponente,
     Proposta,
     PropostaApoiador,
     PropostaEmenda,
 )
 from src.loader.extraction_log import create_extraction_log, get_last_extraction
-from src.loader.upsert import load_extraction_data, upsert_records
+from src.loader.upsert import COPY_THRESHOLD, load_extraction_data, upsert_records
 
 # Skip integration tests if DATABASE_URL not set
 pytestmark = pytest.mark.skipif(
@@ -84,6 +85,7 @@ def cleanup_tables(db_session):
         Apoiador,
         Emenda,
         Programa,
+        Proponente,
         ExtractionLog,
     ]
     for table in tables:
@@ -210,6 +212,70 @@ class TestUpsertRecords:
             )
             assert record.titulo == prop["titulo"]
 
+    def test_upsert_heterogeneous_batch(self, db_session: Session):
+        """Records with differing key sets must neither raise nor drop values.
+
+        Propostas batches are heterogeneous by construction: proponente_cnpj
+        is only added to a record when the CNPJ lookup matches.
+        """
+        propostas = [
+            {"transfer_gov_id": "HET-001", "titulo": "Sem CNPJ"},
+            {
+                "transfer_gov_id": "HET-002",
+                "titulo": "Com CNPJ",
+                "proponente_cnpj": "12345678000199",
+            },
+            {"transfer_gov_id": "HET-003", "titulo": "Tambem sem CNPJ"},
+        ]
+
+        result = upsert_records(db_session, Proposta, propostas)
+        assert result["inserted"] == 3
+
+        with_cnpj = (
+            db_session.query(Proposta)
+            .filter(Proposta.transfer_gov_id == "HET-002")
+            .first()
+        )
+        assert with_cnpj.proponente_cnpj == "12345678000199"
+
+        without_cnpj = (
+            db_session.query(Proposta)
+            .filter(Proposta.transfer_gov_id == "HET-001")
+            .first()
+        )
+        assert without_cnpj.proponente_cnpj is None
+
+    def test_upsert_copy_path_applies_client_defaults(self, db_session: Session):
+        """COPY-path batches must honor client-side defaults for absent columns.
+
+        total_propostas/total_emendas are NOT NULL with only a Python-side
+        default; COPY bypasses SQLAlchemy's default machinery, so the
+        staging rows have to carry the default explicitly.
+        """
+        proponentes = [
+            {
+                "cnpj": str(i).zfill(14),
+                "nome": f"Proponente {i}",
+                "is_osc": True,
+                "total_propostas": 1,
+            }
+            for i in range(COPY_THRESHOLD)
+        ]
+
+        result = upsert_records(
+            db_session, Proponente, proponentes, conflict_column="cnpj"
+        )
+        assert result["inserted"] == COPY_THRESHOLD
+
+        sample = (
+            db_session.query(Proponente)
+            .filter(Proponente.cnpj == "0" * 14)
+            .first()
+        )
+        assert sample is not None
+        assert sample.total_propostas == 1
+        assert sample.total_emendas == 0
+
     def test_upsert_empty_list(self, db_session: Session):
         """Upsert should handle empty list gracefully."""
         result = upsert_records(db_session, Proposta, [])
@@ -339,6 +405,106 @@ class TestLoadExtractionData:
         programa = db_session.query(Programa).first()
         assert programa.extraction_date == extraction_date
 
+    def test_load_extraction_data_skips_unchanged_payload(self, db_session: Session):
+        """A repeated identical payload should take the fingerprint skip path."""
+
+        def make_payload() -> dict:
+            # Fresh dicts per run, as each pipeline run re-parses the files
+            return {
+                "programas": [
+                    {"transfer_gov_id": "PROG-FP-001", "nome": "Programa Fingerprint"}
+                ],
+                "propostas": [
+                    {
+                        "transfer_gov_id": "PROP-FP-001",
+                        "titulo": "Proposta Fingerprint",
+                        "valor_global": 1000.00,
+                    }
+                ],
+            }
+
+        # First run loads normally and persists per-table fingerprints
+        stats1 = load_extraction_data(db_session, make_payload(), date.today())
+        assert stats1["programas"]["inserted"] == 1
+        assert stats1["propostas"]["inserted"] == 1
+        assert stats1["programas"]["fingerprint"]
+        create_extraction_log(db_session, status="success", stats=stats1, duration=1.0)
+        db_session.commit()
+
+        # Second run with identical content skips the SQL round-trips
+        stats2 = load_extraction_data(db_session, make_payload(), date.today())
+        assert stats2["programas"]["skipped"] == 1
+        assert stats2["propostas"]["skipped"] == 1
+        assert stats2["programas"]["inserted"] == 0
+        assert stats2["propostas"]["updated"] == 0
+        assert stats2["programas"]["fingerprint"] == stats1["programas"]["fingerprint"]
+
+        # Data from the first run is untouched
+        assert db_session.query(Programa).count() == 1
+        assert db_session.query(Proposta).count() == 1
+
+    def test_parallel_load_failure_is_not_masked_by_fingerprints(
+        self, db_session: Session, engine
+    ):
+        """A failed parallel worker must surface, and the retry must fully reload.
+
+        Workers commit on their own sessions, so one table can fail while
+        siblings commit. The failed run logs no fingerprints, so the next
+        run must not ride the skip path for any table.
+        """
+        from src.loader import upsert as upsert_module
+
+        SessionLocal = sessionmaker(bind=engine)
+
+        def make_payload() -> dict:
+            return {
+                "programas": [
+                    {"transfer_gov_id": "PROG-PAR-001", "nome": "Programa Paralelo"}
+                ],
+                "apoiadores": [
+                    {"transfer_gov_id": "AP-PAR-001", "nome": "Apoiador Paralelo"}
+                ],
+            }
+
+        real_worker = upsert_module._upsert_on_own_session
+
+        def flaky_worker(
+            session_factory, model_class, records, conflict_column, default_fields
+        ):
+            if model_class.__tablename__ == "apoiadores":
+                raise RuntimeError("simulated worker failure")
+            return real_worker(
+                session_factory, model_class, records, conflict_column, default_fields
+            )
+
+        with patch(
+            "src.loader.upsert._upsert_on_own_session", side_effect=flaky_worker
+        ):
+            with pytest.raises(RuntimeError, match="simulated worker failure"):
+                load_extraction_data(
+                    db_session,
+                    make_payload(),
+                    date.today(),
+                    session_factory=SessionLocal,
+                )
+
+        # The pipeline logs a failed run without stats - no fingerprints
+        create_extraction_log(
+            db_session, status="failed", error="simulated worker failure", duration=0.0
+        )
+        db_session.commit()
+
+        # Retry: nothing may be skipped, and the failed table loads now
+        stats = load_extraction_data(
+            db_session, make_payload(), date.today(), session_factory=SessionLocal
+        )
+        db_session.commit()
+
+        assert not any(table_stats.get("skipped") for table_stats in stats.values())
+        assert stats["apoiadores"]["inserted"] == 1
+        assert db_session.query(Apoiador).count() == 1
+        assert db_session.query(Programa).count() == 1
+
     def test_load_extraction_data_with_empty_tables(self, db_session: Session):
         """load_extraction_data should handle missing tables gracefully."""
         validated_data = {